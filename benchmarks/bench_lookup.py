@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2016-2025 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Offline benchmarks for Wordbook's lookup backend.
+
+The benchmarks run against the small WN-LMF lexicon in fixtures/ and a stub
+espeak-ng, inside a throwaway data directory, so they need neither network
+access nor a real espeak-ng. Results are written as JSON with p50/p95/p99
+timings (in milliseconds) for every hot path.
+
+    python3 benchmarks/bench_lookup.py --output results.json
+    python3 benchmarks/bench_lookup.py --baseline results.json
+
+With --baseline, the run exits with status 1 if any benchmark's p95 got
+slower than the baseline by more than --threshold.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import string
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any
+
+BENCH_DIR = Path(__file__).resolve().parent
+FIXTURE_LEXICON = BENCH_DIR / "fixtures" / "wbbench.xml"
+FIXTURE_LEXICON_SPECIFIER = "wbbench:1"
+STUB_BIN_DIR = BENCH_DIR / "fixtures" / "bin"
+
+# Size of the synthetic wordlist used for index benchmarks; roughly the number
+# of lemmas in Open English WordNet.
+SYNTHETIC_WORDLIST_SIZE = 150_000
+
+RAW_INPUTS = [
+    "  serendipity ",
+    '"acrophobia"',
+    "(run)",
+    "New York?",
+    "<b>bookcase</b>",
+    "fear of heights;",
+    "dog\n",
+    "`happy`!",
+]
+LOOKUP_TERMS = ["run", "set", "dog", "good", "happy", "book", "New York", "serendipity", "geese", "went"]
+INFLECTED_TERMS = ["dogs", "books", "happier", "bigger", "mice"]
+MISSING_TERMS = ["serendipty", "acrofobia", "bookshopp", "hapy", "walkk"]
+PREFIXES = ["s", "se", "ser", "book", "ha", "new y", "q", "zz"]
+REVERSE_QUERIES = ["fear of heights", "traveling on foot", "joy", "furniture for books", "zzz qqq"]
+
+
+def _isolate_environment(root: str) -> None:
+    """Points Wordbook at a throwaway data directory and the stub espeak-ng."""
+    os.environ["XDG_DATA_HOME"] = os.path.join(root, "data")
+    os.environ["XDG_CONFIG_HOME"] = os.path.join(root, "config")
+    os.environ["PATH"] = f"{STUB_BIN_DIR}{os.pathsep}{os.environ.get('PATH', '')}"
+    sys.path.insert(0, str(BENCH_DIR.parent))
+
+
+def _percentile(sorted_samples: Sequence[float], percent: float) -> float:
+    """Nearest-rank percentile of an already sorted sample."""
+    rank = max(1, round(percent / 100 * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+def _summarize(samples: list[float]) -> dict[str, float | int]:
+    ordered = sorted(samples)
+    return {
+        "n": len(ordered),
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 4),
+        "p50_ms": round(_percentile(ordered, 50) * 1000, 4),
+        "p95_ms": round(_percentile(ordered, 95) * 1000, 4),
+        "p99_ms": round(_percentile(ordered, 99) * 1000, 4),
+    }
+
+
+def _synthetic_wordlist(size: int) -> list[str]:
+    """Builds a deterministic wordlist with a realistic spread of lengths."""
+    rng = random.Random(0)
+    words = []
+    for _ in range(size):
+        word = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 12)))
+        if rng.random() < 0.1:
+            word += " " + "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 8)))
+        words.append(word)
+    return words
+
+
+class BenchmarkRunner:
+    """Times callables over a set of inputs and collects the summaries."""
+
+    def __init__(self, iterations: int, only: list[str] | None):
+        self.iterations = iterations
+        self.only = only
+        self.results: dict[str, dict[str, float | int]] = {}
+
+    def bench(
+        self,
+        name: str,
+        func: Callable[[Any], Any],
+        inputs: Sequence[Any],
+        setup: Callable[[], Any] | None = None,
+        iterations: int | None = None,
+    ) -> None:
+        """
+        Runs `func` once per input, `iterations` times over, after one untimed warm-up pass.
+
+        `setup`, if given, runs before every timed call and is not timed.
+        """
+        if self.only and not any(name.startswith(prefix) for prefix in self.only):
+            return
+
+        for item in inputs:
+            if setup:
+                setup()
+            func(item)
+
+        samples = []
+        for _ in range(iterations or self.iterations):
+            for item in inputs:
+                if setup:
+                    setup()
+                start = time.perf_counter()
+                func(item)
+                samples.append(time.perf_counter() - start)
+
+        self.results[name] = _summarize(samples)
+        print(f"{name:40} p50 {self.results[name]['p50_ms']:>10.4f} ms", file=sys.stderr)
+
+
+def run_benchmarks(runner: BenchmarkRunner) -> None:
+    """Registers and runs every benchmark."""
+    from rapidfuzz import fuzz, process
+
+    from wordbook import base, espeak
+    from wordbook.index import FuzzyIndex, PrefixIndex
+
+    wn = base.import_wn()
+    base.create_required_dirs()
+    base.WN_DB_VERSION = FIXTURE_LEXICON_SPECIFIER
+    wn.add(str(FIXTURE_LEXICON), progress_handler=None)
+    wn_instance = wn.Wordnet(lexicon=FIXTURE_LEXICON_SPECIFIER)
+
+    runner.bench("clean_search_terms", base.clean_search_terms, RAW_INPUTS)
+
+    runner.bench(
+        "get_definition.cold",
+        lambda term: base.get_definition(term, wn_instance),
+        LOOKUP_TERMS,
+        setup=base.DEFINITION_CACHE.clear,
+    )
+    runner.bench("get_definition.cached", lambda term: base.get_definition(term, wn_instance), LOOKUP_TERMS)
+    runner.bench(
+        "get_definition.inflected",
+        lambda term: base.get_definition(term, wn_instance),
+        INFLECTED_TERMS,
+        setup=base.DEFINITION_CACHE.clear,
+    )
+    runner.bench(
+        "get_definition.miss",
+        lambda term: base.get_definition(term, wn_instance),
+        MISSING_TERMS,
+        setup=base.DEFINITION_CACHE.clear,
+    )
+    runner.bench(
+        "iter_definition.first_group",
+        lambda term: next(base.iter_definition(term, wn_instance), None),
+        LOOKUP_TERMS,
+        setup=base.DEFINITION_CACHE.clear,
+    )
+
+    base.update_snapshot().result()
+    runner.bench(
+        "get_definition.snapshot",
+        lambda term: base.get_definition(term, wn_instance),
+        LOOKUP_TERMS,
+        setup=base.DEFINITION_CACHE.clear,
+    )
+    runner.bench("snapshot.build", lambda _: base.update_snapshot().result(), [None], setup=base.delete_snapshot)
+    base.delete_snapshot()
+
+    base.update_reverse_index().result()
+    runner.bench("reverse_lookup", base.reverse_lookup, REVERSE_QUERIES)
+    runner.bench(
+        "reverse_index.build", lambda _: base.update_reverse_index().result(), [None], setup=base.delete_reverse_index
+    )
+    base.delete_reverse_index()
+
+    synsets = [(term, synset) for term in LOOKUP_TERMS for synset in wn_instance.synsets(term.lower())]
+    lemma_lists = [(term, synset.lemmas()) for term, synset in synsets]
+    matched_synsets = [
+        (synset, base._find_best_lemma_match(term, lemmas))
+        for (term, lemmas), (_, synset) in zip(lemma_lists, synsets, strict=True)
+    ]
+    runner.bench("find_best_lemma_match", lambda args: base._find_best_lemma_match(*args), lemma_lists)
+    runner.bench("extract_related_lemmas", lambda args: base._extract_related_lemmas(*args), matched_synsets)
+
+    term_synsets = [wn_instance.synsets(term.lower()) for term in LOOKUP_TERMS]
+    runner.bench(
+        "synset_records.per_synset",
+        lambda synsets: [base._synset_record(synset) for synset in synsets],
+        term_synsets,
+    )
+    runner.bench("synset_records.batched", base.RELATION_LOADER.load, term_synsets)
+
+    runner.bench(
+        "wordlist.build",
+        lambda _: base.get_wn_wordlist(wn_instance).result(),
+        [None],
+        setup=base.delete_wordlist_cache,
+    )
+    runner.bench("wordlist.cached", lambda _: base.get_wn_wordlist(wn_instance).result(), [None])
+
+    synthetic_words = _synthetic_wordlist(SYNTHETIC_WORDLIST_SIZE)
+    runner.bench("prefix_index.build", PrefixIndex, [synthetic_words], iterations=3)
+    fixture_index = PrefixIndex(base.get_wn_wordlist(wn_instance).result())
+    synthetic_index = PrefixIndex(synthetic_words)
+    runner.bench("completion.fixture", fixture_index.complete, PREFIXES)
+    runner.bench("completion.synthetic", synthetic_index.complete, PREFIXES)
+
+    runner.bench(
+        "suggestions.rapidfuzz_scan",
+        lambda term: process.extract(term, synthetic_words, limit=5, scorer=fuzz.QRatio),
+        MISSING_TERMS,
+        iterations=2,
+    )
+    runner.bench("fuzzy_index.build", FuzzyIndex, [synthetic_words], iterations=3)
+    fuzzy_index = FuzzyIndex(synthetic_words)
+    runner.bench("suggestions.fuzzy_index", fuzzy_index.search, MISSING_TERMS)
+
+    runner.bench("pronunciation.spawn", lambda term: base._run_espeak_ipa(term, "us"), LOOKUP_TERMS, iterations=3)
+    ipa_worker = espeak.get_ipa_worker("us")
+    runner.bench("pronunciation.worker", ipa_worker.transcribe, LOOKUP_TERMS)
+    runner.bench("pronunciation.worker_batch", ipa_worker.transcribe_many, [LOOKUP_TERMS])
+    runner.bench(
+        "pronunciation.stored",
+        lambda term: base.get_pronunciation(term, "us"),
+        LOOKUP_TERMS,
+        setup=base.get_pronunciation.cache_clear,
+    )
+
+
+def _find_regressions(
+    current: dict[str, dict[str, Any]], baseline: dict[str, dict[str, Any]], threshold: float
+) -> list[str]:
+    regressions = []
+    for name, summary in current.items():
+        previous = baseline.get(name)
+        if previous and summary["p95_ms"] > previous["p95_ms"] * threshold:
+            regressions.append(f"{name}: p95 {previous['p95_ms']:.4f} ms -> {summary['p95_ms']:.4f} ms")
+    return regressions
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", "--iterations", type=int, default=20, help="timed passes over each input set")
+    parser.add_argument("-o", "--output", help="write the JSON results to this file instead of stdout")
+    parser.add_argument("--only", nargs="*", help="only run benchmarks whose names start with these prefixes")
+    parser.add_argument("--baseline", help="a previous JSON result to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="allowed p95 slowdown factor (default: 1.25)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="wordbook-bench-") as root:
+        _isolate_environment(root)
+        import wn
+
+        runner = BenchmarkRunner(args.iterations, args.only)
+        run_benchmarks(runner)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "wn": wn.__version__,
+            "iterations": args.iterations,
+            "synthetic_wordlist_size": SYNTHETIC_WORDLIST_SIZE,
+        },
+        "benchmarks": runner.results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())["benchmarks"]
+        regressions = _find_regressions(runner.results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -5,30 +5,47 @@
 Base module for Wordbook, containing UI-independent logic.
 """
 
+from __future__ import annotations
+
 import difflib
+import json
+import mmap
 import os
+import sqlite3
 import subprocess
+import sys
 import threading
-from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from functools import lru_cache
 from shutil import rmtree
-from typing import Any
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
 
-import wn
+from wordbook import timing, utils
+from wordbook.espeak import PRONUNCIATION_STORE, espeak_version, format_ipa, get_ipa_worker, get_speech_worker
+from wordbook.index import PrefixIndex
+from wordbook.reverse import ReverseIndex, build_reverse_index
+from wordbook.snapshot import LexiconSnapshot, build_snapshot, lexicon_rowid, read_synset_records
+from wordbook.timing import LOOKUP_STATS
 
-from wordbook import utils
+if TYPE_CHECKING:
+    import wn
 
-POOL = ThreadPoolExecutor()
 WN_DB_VERSION: str = "oewn:2024"
 
-# Global lock for WordNet database operations to prevent concurrent access.
-# This is critical for ensuring that wordlist loading and search operations
-# do not interfere with each other.
-WN_DATABASE_LOCK = threading.Lock()
+# Global reader/writer lock for WordNet database operations. Lookups and
+# wordlist loading only read from the database and share the lock, so they run
+# in parallel. Downloading, deleting and re-initializing WordNet take it
+# exclusively, so they never run underneath a reader.
+WN_DATABASE_LOCK = utils.ReadWriteLock()
 
-wn.config.data_directory = os.path.join(utils.WN_DIR)
-wn.config.allow_multithreading = True
+# Shared worker pool for @_threadpool functions, created on first use.
+_pool: ThreadPoolExecutor | None = None
+_pool_lock = threading.Lock()
 
 POS_MAP: dict[str, str] = {
     "s": "adjective",
@@ -49,6 +66,472 @@ LIGHT_MODE_SENTENCE_COLOR = "blue"
 SEARCH_TERM_CLEANUP_CHARS = '<>"-?`![](){}/:;,'
 SEARCH_TERM_REPLACE_CHARS = ["(", ")", "<", ">", "[", "]", "&", "\\", "\n"]
 
+# On-disk wordlist cache. The header records the lexicon version and the
+# modification time of wn.db so that a re-download invalidates the cache.
+WORDLIST_CACHE_FILE: str = os.path.join(utils.DATA_DIR, "wordlist.cache")
+WORDLIST_CACHE_MAGIC = "WBWL1"
+
+# Read-only snapshot of the lexicon, used instead of the wn ORM when present.
+SNAPSHOT_FILE: str = os.path.join(utils.DATA_DIR, "lexicon.snapshot")
+
+# Full-text index of definitions and examples, for reverse lookups.
+REVERSE_INDEX_FILE: str = os.path.join(utils.DATA_DIR, "reverse.db")
+
+# A search starting with this prefix looks for words by their definition, and
+# its results are shown under this heading instead of a part of speech.
+REVERSE_SEARCH_PREFIX = "?"
+REVERSE_SEARCH_GROUP = "matching definitions"
+REVERSE_SEARCH_LIMIT = 30
+
+
+class DefinitionCache:
+    """
+    A bounded, thread-safe LRU cache of processed definition data.
+
+    Entries are keyed on the lexicon version, the wn.db modification time and
+    the lowercased term, which is what get_definition() queries WordNet with,
+    so entries read before the database was replaced are never served.
+    Nothing is cached while wn.db is missing. Cached dictionaries are shared
+    between callers and must not be mutated.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str, str], dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(term: str) -> tuple[str, str, str] | None:
+        db_key = _wordlist_cache_key()
+        if db_key is None:
+            return None
+        return *db_key, term.strip().lower()
+
+    def get(self, term: str) -> dict[str, Any] | None:
+        """Returns the cached definition data for a term, or None on a miss."""
+        key = self._key(term)
+        with self._lock:
+            if key is None:
+                self.misses += 1
+                return None
+            data = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def __contains__(self, term: str) -> bool:
+        """Whether a term is cached, without counting a hit or miss or refreshing the entry."""
+        key = self._key(term)
+        with self._lock:
+            return key is not None and key in self._entries
+
+    def put(self, term: str, data: dict[str, Any]) -> None:
+        """Stores definition data for a term, evicting the least recently used entry if full."""
+        key = self._key(term)
+        if key is None:
+            return
+        with self._lock:
+            self._entries[key] = data
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drops every cached entry. Used when the lexicon is replaced or removed."""
+        with self._lock:
+            self._entries.clear()
+        utils.log_info("Definition cache cleared.")
+
+    def stats(self) -> dict[str, int]:
+        """Returns the hit/miss counters and current size of the cache."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+
+DEFINITION_CACHE = DefinitionCache()
+
+
+def _open_wn_database() -> sqlite3.Connection:
+    """Opens a read-only connection to wn.db, separate from the one wn uses."""
+    db_path = os.path.join(utils.WN_DIR, "wn.db")
+    return sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, check_same_thread=False)
+
+
+class Lemmatizer:
+    """
+    Maps inflected forms to WordNet lemmas, e.g. "running" -> "run" or "mice" -> "mouse".
+
+    Irregular forms come from an exceptions table built from the lexicon's
+    alternative word forms. Regular inflections are undone with Morphy's
+    detachment rules, and a candidate is only accepted if it is a known lemma.
+    Both tables are loaded with two SQL queries on first use, which is far
+    cheaper than wn.morphy.Morphy(wordnet) walking every word. Resolved forms,
+    including misses, are memoized.
+    """
+
+    # Parts of speech tried in order when a form could be several of them.
+    POS_ORDER = ("n", "v", "a", "r")
+    # Spelling changes Morphy's rules leave out: "happier" -> "happy",
+    # "carried" -> "carry", and doubled final consonants ("bigger" -> "big",
+    # "stopped" -> "stop", "running" -> "run").
+    EXTRA_SUFFIXES = (("ier", "y"), ("iest", "y"), ("ied", "y"))
+    DOUBLING_SUFFIXES = ("er", "est", "ed", "ing")
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._key: tuple[str, str] | None = None
+        self._exceptions: dict[str, str] = {}
+        self._lemmas: set[str] = set()
+        self._memo: OrderedDict[str, str | None] = OrderedDict()
+        self._morphy: Any = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> None:
+        key = _wordlist_cache_key()
+        if key is None or key == self._key:
+            return
+
+        lexicon_id, _, version = WN_DB_VERSION.partition(":")
+        exceptions: dict[str, str] = {}
+        lemmas: set[str] = set()
+        try:
+            connection = _open_wn_database()
+            try:
+                lemma_rows = connection.execute(
+                    "SELECT f.form FROM forms AS f JOIN lexicons AS l ON l.rowid = f.lexicon_rowid"
+                    " WHERE l.id = ? AND l.version = ? AND f.rank = 0",
+                    (lexicon_id, version),
+                )
+                lemmas.update(form.lower() for (form,) in lemma_rows)
+                exception_rows = connection.execute(
+                    "SELECT f.form, lemma.form FROM forms AS f"
+                    " JOIN forms AS lemma ON lemma.entry_rowid = f.entry_rowid AND lemma.rank = 0"
+                    " JOIN lexicons AS l ON l.rowid = f.lexicon_rowid"
+                    " WHERE l.id = ? AND l.version = ? AND f.rank > 0"
+                    " ORDER BY f.rowid",
+                    (lexicon_id, version),
+                )
+                for form, lemma in exception_rows:
+                    exceptions.setdefault(form.lower(), lemma.lower())
+            finally:
+                connection.close()
+        except sqlite3.Error as e:
+            utils.log_warning(f"Could not load lemmatizer tables: {e}")
+            return
+
+        self._key = key
+        self._exceptions = exceptions
+        self._lemmas = lemmas
+        self._memo.clear()
+        utils.log_info(f"Lemmatizer loaded {len(lemmas)} lemmas and {len(exceptions)} irregular forms.")
+
+    def lemmatize(self, term: str) -> str | None:
+        """
+        Returns the lemma for an inflected form, or None if no lemma could be found.
+
+        Args:
+            term: The form to resolve, e.g. "geese" or "happier".
+
+        Returns:
+            The lowercased lemma, which differs from the lowercased term.
+        """
+        form = term.strip().lower()
+        with self._lock:
+            self._load()
+            if form in self._memo:
+                self._memo.move_to_end(form)
+                return self._memo[form]
+
+            lemma = self._exceptions.get(form)
+            if lemma is None:
+                if self._morphy is None:
+                    import_wn()
+                    from wn.morphy import Morphy
+
+                    self._morphy = Morphy()
+                candidates = self._morphy(form)
+                for pos in self.POS_ORDER:
+                    known = sorted(c for c in candidates.get(pos, ()) if c != form and c in self._lemmas)
+                    if known:
+                        lemma = known[0]
+                        break
+            if lemma is None:
+                lemma = next((c for c in self._extra_candidates(form) if c in self._lemmas), None)
+
+            self._memo[form] = lemma
+            while len(self._memo) > self.maxsize:
+                self._memo.popitem(last=False)
+            return lemma
+
+    def _extra_candidates(self, form: str) -> Iterator[str]:
+        for suffix, replacement in self.EXTRA_SUFFIXES:
+            if form.endswith(suffix) and len(form) > len(suffix) + 1:
+                yield form[: -len(suffix)] + replacement
+        for suffix in self.DOUBLING_SUFFIXES:
+            stem = form[: -len(suffix)]
+            if form.endswith(suffix) and len(stem) > 2 and stem[-1] == stem[-2]:
+                yield stem[:-1]
+
+    def clear(self) -> None:
+        """Forgets the loaded tables, so that they are reloaded on next use."""
+        with self._lock:
+            self._key = None
+            self._exceptions = {}
+            self._lemmas = set()
+            self._memo.clear()
+
+
+LEMMATIZER = Lemmatizer()
+
+
+class RelationLoader:
+    """
+    Loads everything get_definition() needs for a term's synsets in a fixed number of queries.
+
+    Going through the wn API costs a query per synset for its lemmas,
+    definition and examples, a query per sense for antonyms, and a query per
+    related synset for its lemmas, which adds up to hundreds of round trips
+    for words like "run" or "set". This reads the same data with a handful of
+    set-based queries (see wordbook.snapshot.read_synset_records) over a
+    read-only connection per thread.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def _connect(self) -> tuple[sqlite3.Connection, int]:
+        key = _wordlist_cache_key()
+        local = self._local
+        if getattr(local, "key", None) != key or key is None:
+            if getattr(local, "connection", None) is not None:
+                local.connection.close()
+                local.connection = None
+            connection = _open_wn_database()
+            local.lexicon_rowid = lexicon_rowid(connection, WN_DB_VERSION)
+            local.connection = connection
+            local.key = key
+        return local.connection, local.lexicon_rowid
+
+    def load(self, synsets: list[wn.Synset]) -> list[list[Any]]:
+        """
+        Returns the [pos, lemmas, definition, examples, antonyms, similar, also] record of each synset.
+
+        Raises:
+            sqlite3.Error: If the database cannot be read.
+            KeyError: If a synset is not part of the configured lexicon.
+            ValueError: If the configured lexicon is not installed.
+        """
+        connection, lexicon = self._connect()
+        ids = [synset.id for synset in synsets]
+        rowids = dict(
+            connection.execute(
+                "SELECT id, rowid FROM synsets WHERE lexicon_rowid = ? AND id IN (SELECT value FROM json_each(?))",
+                (lexicon, json.dumps(ids)),
+            ).fetchall()
+        )
+        return read_synset_records(connection, lexicon, [rowids[synset_id] for synset_id in ids])
+
+
+RELATION_LOADER = RelationLoader()
+
+
+class SearchScheduler:
+    """
+    Runs searches one at a time on a dedicated worker thread, newest request first.
+
+    Submitting a query replaces any query that has not started yet, so fast
+    typing never builds up a queue of lookups. A search that is already
+    running cannot be interrupted, but its result is dropped instead of being
+    delivered once a newer query has been submitted. An optional debounce
+    delay lets a burst of submissions collapse into a single search.
+    """
+
+    def __init__(self, search: Callable[[int, Any], Any], on_result: Callable[[int, Any], None]):
+        """
+        Args:
+            search: Performs a search for a generation and query. Runs on the
+                worker thread, and may use is_current() to stop early or to
+                deliver partial results of its own.
+            on_result: Receives the generation and result of every search that
+                is still current when it finishes. Runs on the worker thread.
+        """
+        self._search = search
+        self._on_result = on_result
+        self._generation = 0
+        self._pending: tuple[int, Any, float] | None = None
+        self._condition = threading.Condition()
+        self._shutdown = False
+        self._thread = threading.Thread(target=self._run, name="wordbook-search", daemon=True)
+        self._thread.start()
+
+    def submit(self, query: Any, debounce: float = 0.0) -> int:
+        """
+        Schedules a search, replacing any search that has not started yet.
+
+        Args:
+            query: The query passed to the search function.
+            debounce: Seconds to wait for a newer submission before searching.
+
+        Returns:
+            The generation of this request, for use with is_current().
+        """
+        with self._condition:
+            self._generation += 1
+            self._pending = (self._generation, query, time.monotonic() + debounce)
+            self._condition.notify()
+            return self._generation
+
+    def cancel(self) -> None:
+        """Drops the pending search and the result of any running one."""
+        with self._condition:
+            self._generation += 1
+            self._pending = None
+
+    def is_current(self, generation: int) -> bool:
+        """Whether a request is still the newest one."""
+        return generation == self._generation
+
+    def has_pending(self) -> bool:
+        """Whether a newer search is waiting, i.e. the running one is already stale."""
+        return self._pending is not None
+
+    def shutdown(self) -> None:
+        """Stops the worker thread after the running search, if any, finishes."""
+        with self._condition:
+            self._shutdown = True
+            self._pending = None
+            self._condition.notify()
+
+    def _next_request(self) -> tuple[int, Any] | None:
+        with self._condition:
+            while not self._shutdown:
+                if self._pending is None:
+                    self._condition.wait()
+                    continue
+                generation, query, not_before = self._pending
+                delay = not_before - time.monotonic()
+                if delay > 0:
+                    # A newer submission wakes us up and restarts the wait.
+                    self._condition.wait(delay)
+                    continue
+                self._pending = None
+                return generation, query
+            return None
+
+    def _run(self) -> None:
+        while (request := self._next_request()) is not None:
+            generation, query = request
+            try:
+                result = self._search(generation, query)
+            except Exception as e:
+                utils.log_error(f"Search for {query!r} failed: {e}")
+                continue
+            if self.is_current(generation):
+                self._on_result(generation, result)
+
+
+class Prefetcher:
+    """
+    Looks up terms the user is likely to search for next, so that they are already in DEFINITION_CACHE.
+
+    Lookups run one at a time on a dedicated low-priority worker thread. Each
+    call to prefetch() replaces the terms that are still waiting, and cancel()
+    drops them, so an interactive search never queues behind prefetching: at
+    most it runs alongside the one lookup in progress.
+    """
+
+    # Niceness of the worker thread, where the platform supports per-thread priorities.
+    NICENESS = 10
+
+    def __init__(self, limit: int = 32):
+        """
+        Args:
+            limit: The maximum number of terms looked up per prefetch() call.
+        """
+        self.limit = limit
+        self._terms: list[str] = []
+        self._wn_instance: wn.Wordnet | None = None
+        self._condition = threading.Condition()
+        self._shutdown = False
+        self._thread: threading.Thread | None = None
+
+    def prefetch(self, terms: Iterable[str], wn_instance: wn.Wordnet) -> None:
+        """
+        Replaces the waiting terms with new ones, skipping duplicates and terms that are already cached.
+
+        Args:
+            terms: The terms to look up, most likely first.
+            wn_instance: The initialized Wordnet instance.
+        """
+        queued = [term for term in dict.fromkeys(terms) if term and term not in DEFINITION_CACHE][: self.limit]
+        with self._condition:
+            if self._shutdown:
+                return
+            # Popped from the end, so the most likely term goes last.
+            self._terms = queued[::-1]
+            self._wn_instance = wn_instance
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="wordbook-prefetch", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def cancel(self) -> None:
+        """Drops the waiting terms. A lookup already in progress still completes."""
+        with self._condition:
+            self._terms = []
+
+    def shutdown(self) -> None:
+        """Stops the worker thread after the lookup in progress, if any."""
+        with self._condition:
+            self._shutdown = True
+            self._terms = []
+            self._condition.notify()
+
+    def _next_term(self) -> tuple[str, wn.Wordnet] | None:
+        with self._condition:
+            while not self._shutdown:
+                if self._terms:
+                    return self._terms.pop(), self._wn_instance
+                self._condition.wait()
+            return None
+
+    def _run(self) -> None:
+        if sys.platform == "linux":
+            # Linux applies a thread id's niceness to just that thread.
+            try:
+                os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), self.NICENESS)
+            except OSError as e:
+                utils.log_info(f"Could not lower the prefetch thread's priority: {e}")
+
+        while (request := self._next_term()) is not None:
+            term, wn_instance = request
+            if term in DEFINITION_CACHE:
+                continue
+            try:
+                with WN_DATABASE_LOCK.read():
+                    get_definition(term, wn_instance)
+            except Exception as e:
+                utils.log_warning(f"Prefetching {term!r} failed: {e}")
+
+
+@contextmanager
+def wn_database_read() -> Iterator[None]:
+    """Holds WN_DATABASE_LOCK in shared mode for the duration of the block, recording how long it took to acquire."""
+    start = time.perf_counter()
+    with WN_DATABASE_LOCK.read():
+        LOOKUP_STATS.record(timing.LOCK_WAIT, time.perf_counter() - start)
+        yield
+
 
 def _threadpool(func: Callable) -> Callable:
     """
@@ -57,19 +540,49 @@ def _threadpool(func: Callable) -> Callable:
     """
 
     def wrap(*args: Any, **kwargs: Any) -> Any:
-        return (POOL).submit(func, *args, **kwargs)
+        return _get_pool().submit(func, *args, **kwargs)
 
     return wrap
 
 
+def _get_pool() -> ThreadPoolExecutor:
+    """Returns the shared worker pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor()
+        return _pool
+
+
+@lru_cache(maxsize=1)
+def import_wn() -> ModuleType:
+    """
+    Imports wn and points it at Wordbook's data directory.
+
+    wn is by far the slowest dependency to import, so it is loaded on first use,
+    normally on a worker thread after the window is shown, instead of with this
+    module. Anything using wn directly must go through this first.
+
+    Returns:
+        The wn module.
+    """
+    import wn
+
+    wn.config.data_directory = os.path.join(utils.WN_DIR)
+    wn.config.allow_multithreading = True
+    return wn
+
+
 def clean_search_terms(search_term: str) -> str:
     """
     Cleans up search terms by removing leading/trailing whitespace,
     specific punctuation, and unwanted characters.
     """
+    start = time.perf_counter()
     text = search_term.strip().strip(SEARCH_TERM_CLEANUP_CHARS)
     for char in SEARCH_TERM_REPLACE_CHARS:
         text = text.replace(char, "")
+    LOOKUP_STATS.record(timing.CLEAN, time.perf_counter() - start)
     return text
 
 
@@ -94,18 +607,24 @@ def fetch_definition(term: str, wn_instance: wn.Wordnet, accent: str = "us") ->
     """
     definition_data = get_definition(term, wn_instance)
     pronunciation_term = definition_data.get("term") or term
-    pron = get_pronunciation(pronunciation_term, accent)
-    final_pron = pron if pron and not pron.isspace() else "Pronunciation unavailable (is espeak-ng installed?)"
 
     final_data: dict[str, Any] = {
         "term": definition_data.get("term", term),
-        "pronunciation": final_pron,
+        "pronunciation": fetch_pronunciation(pronunciation_term, accent),
         "result": definition_data.get("result"),
     }
 
     return final_data
 
 
+def fetch_pronunciation(term: str, accent: str = "us") -> str:
+    """Gets the pronunciation of a term for display, or a notice if it is unavailable."""
+    start = time.perf_counter()
+    pron = get_pronunciation(term, accent)
+    LOOKUP_STATS.record(timing.PRONUNCIATION, time.perf_counter() - start)
+    return pron if pron and not pron.isspace() else "Pronunciation unavailable (is espeak-ng installed?)"
+
+
 def _normalize_lemma(lemma: str) -> str:
     """Normalize a lemma by replacing underscores with spaces and stripping whitespace."""
     return lemma.replace("_", " ").strip()
@@ -149,10 +668,21 @@ def _extract_related_lemmas(synset: wn.Synset, matched_lemma: str) -> dict[str,
     return related
 
 
+def _pos_name(pos_tag: str, term: str) -> str:
+    pos_name = POS_MAP.get(pos_tag)
+    if not pos_name:
+        utils.log_warning(f"Unknown POS tag encountered: {pos_tag} for term '{term}'")
+        pos_name = POS_MAP["u"]  # Default to 'unknown'
+    return pos_name
+
+
 def get_definition(term: str, wn_instance: wn.Wordnet) -> dict[str, Any]:
     """
     Gets the definition from WordNet, processes it, and prepares data structure.
 
+    Results are served from DEFINITION_CACHE when possible, and read from the
+    lexicon snapshot instead of the wn database when one is available.
+
     Args:
         term: The term to define.
         wn_instance: The initialized Wordnet instance.
@@ -160,46 +690,230 @@ def get_definition(term: str, wn_instance: wn.Wordnet) -> dict[str, Any]:
     Returns:
         A dictionary with the processed definition data ('term', 'result').
     """
-    first_match: str | None = None
-    result_dict: dict[str, Any] = {pos: [] for pos in POS_MAP.values()}
+    start = time.perf_counter()
+    cached = DEFINITION_CACHE.get(term)
+    if cached is not None:
+        LOOKUP_STATS.record(timing.LOOKUP, time.perf_counter() - start)
+        if cached["result"] is None:
+            return {"term": term, "result": None}
+        return cached
+
+    snapshot = get_snapshot()
+    if snapshot is not None:
+        clean_def = _definition_from_snapshot(term, snapshot)
+    else:
+        clean_def = _definition_from_wordnet(term, wn_instance)
+    DEFINITION_CACHE.put(term, clean_def)
+    LOOKUP_STATS.record(timing.LOOKUP, time.perf_counter() - start)
+    return clean_def
+
+
+def iter_definition(term: str, wn_instance: wn.Wordnet) -> Iterator[dict[str, Any]]:
+    """
+    Yields the definition data for a term one part of speech at a time.
+
+    This is the streaming counterpart of get_definition(): every item has the
+    same 'term' and 'result' keys as its return value, with 'result' holding a
+    single part of speech, in POS_MAP order. When reading from the wn database,
+    the records of each part of speech are only loaded once the previous one
+    has been consumed, so the first group can be shown while the relations of
+    the others are still being read. Nothing is yielded if the term has no
+    definition. The complete definition is added to DEFINITION_CACHE, and the
+    time from the first item to the last to LOOKUP_STATS, once the generator
+    is exhausted.
 
+    Args:
+        term: The term to define.
+        wn_instance: The initialized Wordnet instance.
+    """
+    start = time.perf_counter()
+    definition = DEFINITION_CACHE.get(term)
+    if definition is None:
+        snapshot = get_snapshot()
+        if snapshot is not None:
+            # Snapshot records are read from memory, so there is nothing to gain from streaming them.
+            definition = _definition_from_snapshot(term, snapshot)
+            DEFINITION_CACHE.put(term, definition)
+
+    if definition is not None:
+        for pos_name, synsets in (definition["result"] or {}).items():
+            if synsets:
+                yield {"term": definition["term"], "result": {pos_name: synsets}}
+        LOOKUP_STATS.record(timing.LOOKUP, time.perf_counter() - start)
+        return
+
+    lookup_term, synsets = _find_synsets(term, wn_instance)
+    groups: dict[str, list[wn.Synset]] = {pos: [] for pos in POS_MAP.values()}
+    for synset in synsets:
+        groups[_pos_name(synset.pos, term)].append(synset)
+
+    records: dict[str, list[Any]] = {}
+    relations_time = 0.0
+
+    def records_of(batch: list[wn.Synset]) -> list[list[Any]]:
+        nonlocal relations_time
+        missing = [synset for synset in batch if synset.id not in records]
+        if missing:
+            loading_start = time.perf_counter()
+            records.update(zip([synset.id for synset in missing], _load_synset_records(missing), strict=True))
+            relations_time += time.perf_counter() - loading_start
+        return [records[synset.id] for synset in batch]
+
+    # Like get_definition(), the result is named after the first synset with
+    # lemmas, so that synset is read together with the first group.
+    first_group = next((group for group in groups.values() if group), [])
+    records_of([*synsets[:1], *first_group])
+    matching_start = time.perf_counter()
+    first_match = next(
+        (
+            _find_best_lemma_match(lookup_term, lemmas)
+            for synset in synsets
+            if (lemmas := records_of([synset])[0][1])
+        ),
+        None,
+    )
+    matching_time = time.perf_counter() - matching_start
+    if first_match is None:
+        DEFINITION_CACHE.put(term, {"term": term, "result": None})
+        LOOKUP_STATS.record(timing.RELATIONS, relations_time)
+        LOOKUP_STATS.record(timing.LOOKUP, time.perf_counter() - start)
+        return
+
+    result_dict: dict[str, Any] = {pos: [] for pos in POS_MAP.values()}
+    for pos_name, pos_synsets in groups.items():
+        if not pos_synsets:
+            continue
+        group_records = records_of(pos_synsets)
+        matching_start = time.perf_counter()
+        for record in group_records:
+            synset_data = _synset_data(lookup_term, record)
+            if synset_data is not None:
+                result_dict[pos_name].append(synset_data)
+        matching_time += time.perf_counter() - matching_start
+        if result_dict[pos_name]:
+            yield {"term": first_match, "result": {pos_name: result_dict[pos_name]}}
+
+    DEFINITION_CACHE.put(term, {"term": first_match, "result": result_dict})
+    LOOKUP_STATS.record(timing.RELATIONS, relations_time)
+    LOOKUP_STATS.record(timing.LEMMA_MATCH, matching_time)
+    LOOKUP_STATS.record(timing.LOOKUP, time.perf_counter() - start)
+
+
+def _find_synsets(term: str, wn_instance: wn.Wordnet) -> tuple[str, list[wn.Synset]]:
+    """Finds the synsets of a term, or of its lemma if it is an inflected form, and the form they were found under."""
+    start = time.perf_counter()
+    lookup_term = term
     synsets = wn_instance.synsets(term.lower())
+    if not synsets:
+        # Inflected forms ("running", "mice", "happier") are resolved to their
+        # lemma before callers fall back to fuzzy suggestions.
+        lemma = LEMMATIZER.lemmatize(term)
+        if lemma:
+            lookup_term = lemma
+            synsets = wn_instance.synsets(lemma)
+    LOOKUP_STATS.record(timing.SYNSET_QUERY, time.perf_counter() - start)
+    return lookup_term, synsets
+
+
+def _load_synset_records(synsets: list[wn.Synset]) -> list[list[Any]]:
+    """Reads the records of synsets in one batch, or one synset at a time if batching fails."""
+    try:
+        return RELATION_LOADER.load(synsets)
+    except (sqlite3.Error, KeyError, ValueError) as e:
+        utils.log_warning(f"Could not batch-load synsets, falling back to per-synset queries: {e}")
+        return [_synset_record(synset) for synset in synsets]
+
 
+def _definition_from_wordnet(term: str, wn_instance: wn.Wordnet) -> dict[str, Any]:
+    """Builds the definition data for a term from the wn database."""
+    lookup_term, synsets = _find_synsets(term, wn_instance)
     if not synsets:
-        clean_def = {"term": term, "result": None}
-        return clean_def
+        return {"term": term, "result": None}
+    start = time.perf_counter()
+    records = _load_synset_records(synsets)
+    LOOKUP_STATS.record(timing.RELATIONS, time.perf_counter() - start)
+    return _assemble_definition(term, lookup_term, records)
+
+
+def _definition_from_snapshot(term: str, snapshot: LexiconSnapshot) -> dict[str, Any]:
+    """Builds the same definition data as _definition_from_wordnet(), from the lexicon snapshot."""
+    start = time.perf_counter()
+    lookup_term = term
+    records = snapshot.synsets(term.lower())
+    if not records:
+        lemma = LEMMATIZER.lemmatize(term)
+        if lemma:
+            lookup_term = lemma
+            records = snapshot.synsets(lemma)
+    # Snapshot records already hold the relations, so finding them is the whole query.
+    LOOKUP_STATS.record(timing.SYNSET_QUERY, time.perf_counter() - start)
+
+    if not records:
+        return {"term": term, "result": None}
+    return _assemble_definition(term, lookup_term, records)
+
+
+def _synset_record(synset: wn.Synset) -> list[Any]:
+    """Reads a synset record (see wordbook.snapshot) through the wn API, one query at a time."""
+    related = _extract_related_lemmas(synset, "")
+    return [
+        synset.pos,
+        synset.lemmas(),
+        synset.definition(),
+        synset.examples(),
+        related["ant"],
+        related["sim"],
+        related["also_sees"],
+    ]
 
-    for synset in synsets:
-        pos_tag = synset.pos
-        pos_name = POS_MAP.get(pos_tag)
-        if not pos_name:
-            utils.log_warning(f"Unknown POS tag encountered: {pos_tag} for term '{term}'")
-            pos_name = POS_MAP["u"]  # Default to 'unknown'
-
-        lemmas = synset.lemmas()
-        if not lemmas:
-            continue  # Skip synsets with no lemmas
 
-        matched_lemma = _find_best_lemma_match(term, lemmas)
-        if first_match is None:
-            first_match = matched_lemma
+def _assemble_definition(term: str, lookup_term: str, records: list[list[Any]]) -> dict[str, Any]:
+    """
+    Groups synset records by part of speech into the definition data returned by get_definition().
 
-        related_lemmas = _extract_related_lemmas(synset, matched_lemma)
+    Args:
+        term: The term as searched for.
+        lookup_term: The form the synsets were found under, e.g. the lemma of an inflected term.
+        records: [pos, lemmas, definition, examples, antonyms, similar, also] per synset.
+    """
+    start = time.perf_counter()
+    first_match: str | None = None
+    result_dict: dict[str, Any] = {pos: [] for pos in POS_MAP.values()}
 
-        synset_data: dict[str, Any] = {
-            "name": matched_lemma,
-            "definition": synset.definition() or "No definition available.",
-            "examples": synset.examples() or [],
-            **related_lemmas,
-        }
+    for record in records:
+        synset_data = _synset_data(lookup_term, record)
+        if synset_data is None:
+            continue  # Skip synsets with no lemmas
 
-        result_dict[pos_name].append(synset_data)
+        if first_match is None:
+            first_match = synset_data["name"]
+        result_dict[_pos_name(record[0], term)].append(synset_data)
 
-    clean_def = {
+    LOOKUP_STATS.record(timing.LEMMA_MATCH, time.perf_counter() - start)
+    return {
         "term": first_match or term,
         "result": result_dict,
     }
-    return clean_def
+
+
+def _synset_data(lookup_term: str, record: list[Any]) -> dict[str, Any] | None:
+    """Turns a synset record into the data shown for one definition, or None if the synset has no lemmas."""
+    _pos_tag, lemmas, definition, examples, antonyms, similar, also_sees = record
+    if not lemmas:
+        return None
+
+    matched_lemma = _find_best_lemma_match(lookup_term, lemmas)
+    return {
+        "name": matched_lemma,
+        "definition": definition or "No definition available.",
+        "examples": examples or [],
+        "syn": [
+            _normalize_lemma(lemma) for lemma in lemmas if _normalize_lemma(lemma).lower() != matched_lemma.lower()
+        ],
+        "ant": antonyms,
+        "sim": similar,
+        "also_sees": also_sees,
+    }
 
 
 @lru_cache(maxsize=128)
@@ -207,6 +921,11 @@ def get_pronunciation(term: str, accent: str = "us") -> str | None:
     """
     Gets the pronunciation of a term using the 'espeak-ng' command-line tool.
 
+    Pronunciations are looked up in the persistent PRONUNCIATION_STORE first.
+    Terms that have never been transcribed with the installed espeak-ng
+    version go to the long-lived IPA worker, and only fall back to a one-off
+    espeak-ng process if the worker cannot handle them.
+
     Args:
         term: The word or phrase to pronounce.
         accent: The espeak-ng accent code (e.g., "us", "gb").
@@ -214,6 +933,50 @@ def get_pronunciation(term: str, accent: str = "us") -> str | None:
     Returns:
         The pronunciation in IPA format (e.g., "/tˈɛst/"), or None if espeak-ng fails.
     """
+    version = espeak_version()
+    if version:
+        stored = PRONUNCIATION_STORE.get(term, accent, version)
+        if stored is not None:
+            return stored
+
+    pronunciation = get_ipa_worker(accent).transcribe(term) or _run_espeak_ipa(term, accent)
+    if pronunciation and version:
+        PRONUNCIATION_STORE.put(term, accent, version, pronunciation)
+    return pronunciation
+
+
+def get_pronunciations(terms: list[str], accent: str = "us") -> dict[str, str | None]:
+    """
+    Gets the pronunciations of many terms, batching espeak-ng work into one round trip.
+
+    Args:
+        terms: The words or phrases to pronounce.
+        accent: The espeak-ng accent code (e.g., "us", "gb").
+
+    Returns:
+        A mapping of each term to its IPA pronunciation, or None if espeak-ng fails.
+    """
+    version = espeak_version()
+    pronunciations: dict[str, str | None] = {}
+    missing: list[str] = []
+    for term in dict.fromkeys(terms):
+        stored = PRONUNCIATION_STORE.get(term, accent, version) if version else None
+        if stored is not None:
+            pronunciations[term] = stored
+        else:
+            missing.append(term)
+
+    transcriptions = get_ipa_worker(accent).transcribe_many(missing)
+    for term, pronunciation in zip(missing, transcriptions, strict=True):
+        pronunciation = pronunciation or _run_espeak_ipa(term, accent)
+        if pronunciation and version:
+            PRONUNCIATION_STORE.put(term, accent, version, pronunciation)
+        pronunciations[term] = pronunciation
+    return pronunciations
+
+
+def _run_espeak_ipa(term: str, accent: str) -> str | None:
+    """Runs espeak-ng once to transcribe a term to IPA."""
     try:
         process = subprocess.Popen(
             [
@@ -231,8 +994,7 @@ def get_pronunciation(term: str, accent: str = "us") -> str | None:
         stdout, stderr = process.communicate(timeout=5)
 
         if process.returncode == 0 and stdout:
-            ipa_pronunciation = stdout.strip().replace("\n", " ").replace("  ", " ")
-            return f"/{ipa_pronunciation.strip('/')}/"
+            return format_ipa(stdout)
 
         utils.log_warning(f"espeak-ng failed for term '{term}'. RC: {process.returncode}. Stderr: {stderr.strip()}")
         return None
@@ -289,8 +1051,10 @@ def get_wn_instance(reloader: Callable[[], None]) -> wn.Wordnet:
         The initialized WordNet instance.
     """
     utils.log_info("Initializing WordNet...")
+    wn = import_wn()
     try:
-        wn_instance: wn.Wordnet = wn.Wordnet(lexicon=WN_DB_VERSION)
+        with WN_DATABASE_LOCK.write():
+            wn_instance: wn.Wordnet = wn.Wordnet(lexicon=WN_DB_VERSION)
         utils.log_info(f"WordNet instance ({WN_DB_VERSION}) created and ready.")
         return wn_instance
 
@@ -304,39 +1068,302 @@ def get_wn_instance(reloader: Callable[[], None]) -> wn.Wordnet:
         raise e
 
 
+def _wordlist_cache_key() -> tuple[str, str] | None:
+    """Returns the (lexicon version, wn.db mtime) pair the wordlist cache is keyed on."""
+    try:
+        db_mtime = os.stat(os.path.join(utils.WN_DIR, "wn.db")).st_mtime_ns
+    except OSError:
+        return None
+    return WN_DB_VERSION, str(db_mtime)
+
+
+def load_wordlist_cache() -> list[str] | None:
+    """
+    Loads the wordlist from the on-disk cache, if it matches the current database.
+
+    Returns:
+        The cached wordlist in completion-index order, or None if there is no valid cache.
+    """
+    cache_key = _wordlist_cache_key()
+    if cache_key is None:
+        return None
+
+    try:
+        with open(WORDLIST_CACHE_FILE, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            header_end = mm.find(b"\n")
+            if header_end == -1:
+                return None
+            magic, version, db_mtime, count = mm[:header_end].decode("utf-8").split("\t")
+            if magic != WORDLIST_CACHE_MAGIC or (version, db_mtime) != cache_key:
+                utils.log_info("Wordlist cache is stale, ignoring it.")
+                return None
+            body = mm[header_end + 1 :].decode("utf-8")
+            wordlist = body.split("\n") if body else []
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        utils.log_warning(f"Could not read wordlist cache: {e}")
+        return None
+
+    if len(wordlist) != int(count):
+        utils.log_warning("Wordlist cache is truncated, ignoring it.")
+        return None
+    return wordlist
+
+
+def save_wordlist_cache(wordlist: list[str]) -> None:
+    """
+    Writes the wordlist to the on-disk cache, replacing any previous cache atomically.
+
+    Args:
+        wordlist: The wordlist in completion-index order.
+    """
+    cache_key = _wordlist_cache_key()
+    if cache_key is None:
+        return
+
+    header = "\t".join([WORDLIST_CACHE_MAGIC, *cache_key, str(len(wordlist))])
+    temp_file = f"{WORDLIST_CACHE_FILE}.tmp"
+    try:
+        with open(temp_file, "w", encoding="utf-8") as f:
+            f.write(header)
+            f.write("\n")
+            f.write("\n".join(wordlist))
+        os.replace(temp_file, WORDLIST_CACHE_FILE)
+        utils.log_info(f"Wordlist cache written to {WORDLIST_CACHE_FILE}.")
+    except OSError as e:
+        utils.log_warning(f"Could not write wordlist cache: {e}")
+
+
+def delete_wordlist_cache() -> None:
+    """Removes the on-disk wordlist cache, if any."""
+    try:
+        os.remove(WORDLIST_CACHE_FILE)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        utils.log_warning(f"Could not delete wordlist cache: {e}")
+
+
+_snapshot: LexiconSnapshot | None = None
+_snapshot_unavailable_key: tuple[str, str] | None = None
+_snapshot_lock = threading.Lock()
+
+
+def get_snapshot() -> LexiconSnapshot | None:
+    """
+    Returns the lexicon snapshot, if one matching the current database has been built.
+
+    The snapshot is opened on first use and dropped once wn.db changes.
+    """
+    global _snapshot, _snapshot_unavailable_key
+    key = _wordlist_cache_key()
+    snapshot = _snapshot
+    if key is None or key == _snapshot_unavailable_key:
+        return None
+    if snapshot is not None and snapshot.key == key:
+        return snapshot
+
+    with _snapshot_lock:
+        if _snapshot is None or _snapshot.key != key:
+            # A stale snapshot is not closed here, as other threads may still
+            # be reading from it. It is unmapped once garbage collected.
+            try:
+                _snapshot = LexiconSnapshot(SNAPSHOT_FILE, key)
+            except FileNotFoundError:
+                _snapshot = None
+                _snapshot_unavailable_key = key
+            except (OSError, ValueError) as e:
+                utils.log_info(f"Lexicon snapshot not used: {e}")
+                _snapshot = None
+                _snapshot_unavailable_key = key
+        return _snapshot
+
+
+@_threadpool
+def update_snapshot() -> bool:
+    """
+    Builds the lexicon snapshot in a thread, unless an up-to-date one exists.
+
+    Returns:
+        Whether an up-to-date snapshot is available afterwards.
+    """
+    global _snapshot_unavailable_key
+    if get_snapshot() is not None:
+        return True
+    key = _wordlist_cache_key()
+    if key is None:
+        return False
+
+    utils.log_info(f"Building lexicon snapshot for {WN_DB_VERSION}...")
+    try:
+        with WN_DATABASE_LOCK.read():
+            build_snapshot(os.path.join(utils.WN_DIR, "wn.db"), WN_DB_VERSION, key, SNAPSHOT_FILE)
+    except (sqlite3.Error, OSError, ValueError) as e:
+        utils.log_warning(f"Could not build lexicon snapshot: {e}")
+        return False
+
+    with _snapshot_lock:
+        _snapshot_unavailable_key = None
+    return get_snapshot() is not None
+
+
+def delete_snapshot() -> None:
+    """Forgets and removes the lexicon snapshot, if any."""
+    global _snapshot, _snapshot_unavailable_key
+    with _snapshot_lock:
+        _snapshot = None
+        _snapshot_unavailable_key = None
+    try:
+        os.remove(SNAPSHOT_FILE)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        utils.log_warning(f"Could not delete lexicon snapshot: {e}")
+
+
+_reverse_index: ReverseIndex | None = None
+_reverse_index_unavailable_key: tuple[str, str] | None = None
+_reverse_index_lock = threading.Lock()
+
+
+def get_reverse_index() -> ReverseIndex | None:
+    """
+    Returns the reverse index, if one matching the current database has been built.
+
+    Like the snapshot, it is opened on first use and dropped once wn.db changes.
+    """
+    global _reverse_index, _reverse_index_unavailable_key
+    key = _wordlist_cache_key()
+    index = _reverse_index
+    if key is None or key == _reverse_index_unavailable_key:
+        return None
+    if index is not None and index.key == key:
+        return index
+
+    with _reverse_index_lock:
+        if _reverse_index is None or _reverse_index.key != key:
+            try:
+                _reverse_index = ReverseIndex(REVERSE_INDEX_FILE, key)
+            except FileNotFoundError:
+                _reverse_index = None
+                _reverse_index_unavailable_key = key
+            except (sqlite3.Error, ValueError) as e:
+                utils.log_info(f"Reverse index not used: {e}")
+                _reverse_index = None
+                _reverse_index_unavailable_key = key
+        return _reverse_index
+
+
+@_threadpool
+def update_reverse_index() -> bool:
+    """
+    Builds the reverse index in a thread, unless an up-to-date one exists.
+
+    Returns:
+        Whether an up-to-date reverse index is available afterwards.
+    """
+    global _reverse_index_unavailable_key
+    if get_reverse_index() is not None:
+        return True
+    key = _wordlist_cache_key()
+    if key is None:
+        return False
+
+    utils.log_info(f"Building reverse index for {WN_DB_VERSION}...")
+    try:
+        with WN_DATABASE_LOCK.read():
+            build_reverse_index(os.path.join(utils.WN_DIR, "wn.db"), WN_DB_VERSION, key, REVERSE_INDEX_FILE)
+    except (sqlite3.Error, OSError, ValueError) as e:
+        utils.log_warning(f"Could not build reverse index: {e}")
+        return False
+
+    with _reverse_index_lock:
+        _reverse_index_unavailable_key = None
+    return get_reverse_index() is not None
+
+
+def delete_reverse_index() -> None:
+    """Forgets and removes the reverse index, if any."""
+    global _reverse_index, _reverse_index_unavailable_key
+    with _reverse_index_lock:
+        _reverse_index = None
+        _reverse_index_unavailable_key = None
+    try:
+        os.remove(REVERSE_INDEX_FILE)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        utils.log_warning(f"Could not delete reverse index: {e}")
+
+
+def reverse_lookup(query: str, limit: int = REVERSE_SEARCH_LIMIT) -> dict[str, Any]:
+    """
+    Finds words whose definition or examples contain the words of a query, e.g. "fear of heights".
+
+    Args:
+        query: The description to search for, without REVERSE_SEARCH_PREFIX.
+        limit: The maximum number of definitions to return.
+
+    Returns:
+        Definition data shaped like get_definition()'s, with the matches, best
+        first, as the only group, under REVERSE_SEARCH_GROUP. 'result' is None
+        if nothing matched or the reverse index has not been built yet.
+    """
+    index = get_reverse_index()
+    if index is None:
+        utils.log_info("Reverse lookup requested before the reverse index was built.")
+        return {"term": query, "result": None}
+
+    start = time.perf_counter()
+    try:
+        records = index.search(query, limit)
+    except sqlite3.Error as e:
+        utils.log_warning(f"Reverse lookup failed for '{query}': {e}")
+        return {"term": query, "result": None}
+    LOOKUP_STATS.record(timing.REVERSE_LOOKUP, time.perf_counter() - start)
+
+    # Every match is named after its first lemma, as there is no searched-for word to match.
+    matches = [synset_data for record in records if (synset_data := _synset_data(record[1][0], record))]
+    return {"term": query, "result": {REVERSE_SEARCH_GROUP: matches} if matches else None}
+
+
 @_threadpool
 def get_wn_wordlist(wn_instance: wn.Wordnet) -> list[str]:
     """
     Fetches the word list from an initialized WordNet instance.
     Uses _threadpool decorator to run in a separate thread.
-    Uses WN_DATABASE_LOCK for each individual lemma access to allow search operations to interrupt.
+
+    The list is served from the on-disk cache when it matches the current
+    database. Otherwise it is rebuilt under a shared WN_DATABASE_LOCK, which
+    lets lookups run alongside it, and written back to the cache.
 
     Args:
         wn_instance: The initialized WordNet instance.
 
     Returns:
-        A list of lemmas from the WordNet database.
+        A list of display-ready lemmas, sorted in completion-index order.
     """
+    wordlist = load_wordlist_cache()
+    if wordlist is not None:
+        utils.log_info(f"WordNet wordlist loaded from cache ({len(wordlist)} lemmas).")
+        return wordlist
+
     utils.log_info("Fetching WordNet wordlist...")
     try:
-        # Get all words first
-        with WN_DATABASE_LOCK:
-            words = list(wn_instance.words())
-
-        # Process lemmas one by one
-        # This allows other WordNet actions to interrupt
         wn_lemmas = []
-        for word in words:
-            try:
-                with WN_DATABASE_LOCK:
-                    lemma = word.lemma()
-                wn_lemmas.append(lemma)
-            except Exception as e:
-                utils.log_warning(f"Error getting lemma for word {e}")
-                continue
-
-        utils.log_info(f"WordNet wordlist fetched ({len(wn_lemmas)} lemmas).")
-        return wn_lemmas
+        with WN_DATABASE_LOCK.read():
+            for word in wn_instance.words():
+                try:
+                    wn_lemmas.append(word.lemma())
+                except Exception as e:
+                    utils.log_warning(f"Error getting lemma for word {e}")
+                    continue
+
+        wordlist = PrefixIndex(wn_lemmas).words
+        utils.log_info(f"WordNet wordlist fetched ({len(wordlist)} lemmas).")
+        save_wordlist_cache(wordlist)
+        return wordlist
     except Exception as e:
         utils.log_error(f"Error fetching WordNet wordlist: {e}")
         return []
@@ -345,7 +1372,8 @@ def get_wn_wordlist(wn_instance: wn.Wordnet) -> list[str]:
 def format_output(text: str, wn_instance: wn.Wordnet, accent: str = "us") -> dict[str, Any] | None:
     """
     Determines colors, handles special commands (fortune, exit), and fetches definitions.
-    Uses WN_DATABASE_LOCK to prevent concurrent access with wordlist loading.
+    Holds WN_DATABASE_LOCK in shared mode, so lookups run in parallel with each
+    other and with wordlist loading.
 
     Args:
         text: The input text (search term or command).
@@ -359,7 +1387,7 @@ def format_output(text: str, wn_instance: wn.Wordnet, accent: str = "us") -> dic
     if text and not text.isspace():
         cleaned_text = clean_search_terms(text)
         if cleaned_text:
-            with WN_DATABASE_LOCK:
+            with wn_database_read():
                 definition_data = fetch_definition(cleaned_text, wn_instance, accent=accent)
                 return definition_data
         else:
@@ -370,15 +1398,91 @@ def format_output(text: str, wn_instance: wn.Wordnet, accent: str = "us") -> dic
         return None
 
 
+def _define_for_batch(query: str, wn_instance: wn.Wordnet, accent: str | None) -> dict[str, Any]:
+    """Looks up a single cleaned term on behalf of define_many()."""
+    try:
+        with wn_database_read():
+            definition_data = get_definition(query, wn_instance)
+    except Exception as e:
+        utils.log_warning(f"Lookup failed for term '{query}': {e}")
+        return {"query": query, "term": query, "result": None, "error": str(e)}
+
+    result: dict[str, Any] = {
+        "query": query,
+        "term": definition_data.get("term", query),
+        "result": definition_data.get("result"),
+    }
+    if accent is not None:
+        result["pronunciation"] = get_pronunciation(result["term"], accent)
+    return result
+
+
+def define_many(
+    terms: Iterable[str],
+    wn_instance: wn.Wordnet,
+    accent: str | None = None,
+    max_workers: int = 4,
+) -> Iterator[dict[str, Any]]:
+    """
+    Looks up many terms in parallel, yielding results as they complete.
+
+    Terms are cleaned with clean_search_terms(); empty and repeated terms are
+    skipped. All lookups share the given WordNet instance and run on a
+    dedicated pool of `max_workers` threads. The input is consumed lazily and
+    only a bounded number of lookups is in flight at once, so arbitrarily
+    long inputs can be streamed through.
+
+    Args:
+        terms: The terms to define.
+        wn_instance: The initialized Wordnet instance.
+        accent: The espeak-ng accent code, or None to skip pronunciations.
+        max_workers: The number of lookups to run at the same time.
+
+    Yields:
+        One dictionary per unique term, in completion order, with the cleaned
+        'query', the matched 'term' and the 'result' of get_definition(). A
+        'pronunciation' is included when an accent is given, and an 'error'
+        when the lookup raised.
+    """
+    max_in_flight = max_workers * 4
+    seen: set[str] = set()
+    in_flight: set[Future] = set()
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="define_many") as executor:
+        for term in terms:
+            query = clean_search_terms(term)
+            if not query or query in seen:
+                continue
+            seen.add(query)
+
+            if len(in_flight) >= max_in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+            in_flight.add(executor.submit(_define_for_batch, query, wn_instance, accent))
+
+        while in_flight:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
 def read_term(text: str, speed: int = 120, accent: str = "us") -> None:
     """
     Uses espeak-ng to speak the given text aloud.
 
+    The text is handed to a long-lived speech worker; a one-off espeak-ng
+    process is only used if the worker cannot be started.
+
     Args:
         text: The text to speak.
         speed: Speaking speed (words per minute).
         accent: The espeak-ng accent code.
     """
+    if get_speech_worker(accent, speed).speak(text):
+        return
+
     try:
         subprocess.run(
             ["espeak-ng", "-s", str(speed), "-v", f"en-{accent}", text],
@@ -422,8 +1526,15 @@ class WordnetDownloader:
             rmtree(download_dir)
 
         utils.log_info(f"Starting download of WordNet version: {WN_DB_VERSION}")
+        wn = import_wn()
         try:
-            _ = wn.download(WN_DB_VERSION, progress_handler=progress_handler)
+            with WN_DATABASE_LOCK.write():
+                try:
+                    _ = wn.download(WN_DB_VERSION, progress_handler=progress_handler)
+                finally:
+                    # Cleared while readers are still locked out, so none can refill the caches from the old lexicon.
+                    DEFINITION_CACHE.clear()
+                    LEMMATIZER.clear()
             utils.log_info(f"WordNet download completed for {WN_DB_VERSION}.")
         except Exception as e:
             utils.log_error(f"WordNet download failed for {WN_DB_VERSION}: {e}")
@@ -436,6 +1547,14 @@ class WordnetDownloader:
         """
         try:
             utils.log_info(f"Deleting WordNet data directory: {utils.WN_DIR}")
-            rmtree(utils.WN_DIR)
+            with WN_DATABASE_LOCK.write():
+                try:
+                    rmtree(utils.WN_DIR)
+                finally:
+                    DEFINITION_CACHE.clear()
+                    LEMMATIZER.clear()
+            delete_wordlist_cache()
+            delete_snapshot()
+            delete_reverse_index()
         except OSError as e:
             utils.log_error(f"Failed to delete WordNet data directory '{utils.WN_DIR}': {e}")
@@ -0,0 +1,118 @@
+# SPDX-FileCopyrightText: 2016-2025 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Headless batch mode for Wordbook.
+
+Reads terms from stdin or a file and writes one JSON object per term to
+stdout. This module must not import GTK or libadwaita, so that it starts
+quickly and can run without a display.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from typing import TYPE_CHECKING, TextIO
+
+from wordbook import base, utils
+
+if TYPE_CHECKING:
+    import wn
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="wordbook --batch",
+        description="Look up terms without opening a window, writing JSON Lines to stdout.",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        nargs="?",
+        const="-",
+        default="-",
+        help="read terms, one per line, from FILE (default: stdin)",
+    )
+    parser.add_argument(
+        "--pronounce",
+        action="store_true",
+        help="include IPA pronunciations (requires espeak-ng)",
+    )
+    parser.add_argument(
+        "--accent",
+        choices=["us", "gb"],
+        default="us",
+        help="pronunciation accent (default: us)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=4,
+        help="number of lookups to run in parallel (default: 4)",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="log progress to stderr",
+    )
+    return parser
+
+
+def _write_results(terms: TextIO, args: argparse.Namespace, wn_instance: wn.Wordnet) -> None:
+    accent = args.accent if args.pronounce else None
+    for result in base.define_many(terms, wn_instance, accent=accent, max_workers=args.jobs):
+        sys.stdout.write(json.dumps(result, ensure_ascii=False))
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+
+
+def main(argv: list[str]) -> int:
+    """
+    Runs the batch mode.
+
+    Args:
+        argv: The command-line arguments, without the program name.
+
+    Returns:
+        The process exit status.
+    """
+    args = _build_parser().parse_args(argv)
+    utils.log_init(args.verbose)
+
+    if args.jobs < 1:
+        print("wordbook: --jobs must be at least 1", file=sys.stderr)
+        return 2
+
+    if not base.WordnetDownloader.check_status():
+        print("wordbook: WordNet data is not downloaded yet. Start Wordbook once to download it.", file=sys.stderr)
+        return 1
+
+    try:
+        wn_instance = base.get_wn_instance(lambda: None).result()
+    except Exception as e:
+        print(f"wordbook: could not open WordNet: {e}", file=sys.stderr)
+        return 1
+
+    try:
+        if args.batch == "-":
+            _write_results(sys.stdin, args, wn_instance)
+        else:
+            with open(args.batch, encoding="utf-8") as terms:
+                _write_results(terms, args, wn_instance)
+    except BrokenPipeError:
+        # The reader went away (e.g. `| head`); that is not an error. Point
+        # stdout at /dev/null so the interpreter's final flush stays quiet.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    except OSError as e:
+        print(f"wordbook: {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        return 130
+
+    return 0
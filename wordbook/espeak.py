@@ -0,0 +1,348 @@
+# SPDX-FileCopyrightText: 2016-2025 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Helpers around the espeak-ng command-line tool, including a persistent
+store of IPA pronunciations shared by the app and the search provider,
+and long-lived espeak-ng worker processes.
+"""
+
+import atexit
+import os
+import re
+import select
+import shutil
+import sqlite3
+import subprocess
+import threading
+import time
+from functools import lru_cache
+
+from wordbook import utils
+
+PRONUNCIATION_DB_FILE: str = os.path.join(utils.DATA_DIR, "pronunciations.db")
+
+# espeak-ng writes one line of IPA per sentence, so only terms that cannot be
+# split into several sentences are sent through a worker. Anything else falls
+# back to a one-off espeak-ng process.
+WORKER_TERM_PATTERN = re.compile(r"[\w' -]*\w[\w' -]*")
+WORKER_REPLY_TIMEOUT = 5.0
+WORKER_BATCH_SIZE = 32
+
+
+@lru_cache(maxsize=1)
+def espeak_version() -> str | None:
+    """
+    Returns the installed espeak-ng version string, or None if espeak-ng is unavailable.
+
+    The value is looked up once per process and is part of the pronunciation
+    store key, so upgrading espeak-ng does not serve stale transcriptions.
+    """
+    try:
+        process = subprocess.run(
+            ["espeak-ng", "--version"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            check=False,
+            timeout=5,
+            text=True,
+        )
+    except (OSError, subprocess.TimeoutExpired) as ex:
+        utils.log_info(f"Could not determine espeak-ng version: {ex}")
+        return None
+
+    if process.returncode != 0 or not process.stdout.strip():
+        return None
+    # e.g. "eSpeak NG text-to-speech: 1.51  Data at: /usr/share/espeak-ng-data"
+    return process.stdout.strip().split("Data at:")[0].strip()
+
+
+class PronunciationStore:
+    """
+    A persistent (term, accent, espeak-ng version) -> IPA store backed by SQLite.
+
+    The database lives in the data directory so that it survives restarts and
+    is shared with the GNOME Shell search provider. The connection is opened
+    lazily and guarded by a lock, so the store can be used from any thread.
+    """
+
+    def __init__(self, path: str = PRONUNCIATION_DB_FILE):
+        self._path = path
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            connection = sqlite3.connect(self._path, timeout=5, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS pronunciations ("
+                " term TEXT NOT NULL,"
+                " accent TEXT NOT NULL,"
+                " version TEXT NOT NULL,"
+                " ipa TEXT NOT NULL,"
+                " PRIMARY KEY (term, accent, version)"
+                ") WITHOUT ROWID"
+            )
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def get(self, term: str, accent: str, version: str) -> str | None:
+        """Returns the stored IPA for a term, or None if it has not been stored yet."""
+        try:
+            with self._lock:
+                row = (
+                    self._connect()
+                    .execute(
+                        "SELECT ipa FROM pronunciations WHERE term = ? AND accent = ? AND version = ?",
+                        (term, accent, version),
+                    )
+                    .fetchone()
+                )
+        except sqlite3.Error as e:
+            utils.log_warning(f"Could not read pronunciation store: {e}")
+            return None
+        return row[0] if row else None
+
+    def put(self, term: str, accent: str, version: str, ipa: str) -> None:
+        """Stores the IPA for a term, replacing any previous value."""
+        try:
+            with self._lock:
+                connection = self._connect()
+                connection.execute(
+                    "INSERT OR REPLACE INTO pronunciations (term, accent, version, ipa) VALUES (?, ?, ?, ?)",
+                    (term, accent, version, ipa),
+                )
+                connection.commit()
+        except sqlite3.Error as e:
+            utils.log_warning(f"Could not write pronunciation store: {e}")
+
+    def close(self) -> None:
+        """Closes the underlying database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+PRONUNCIATION_STORE = PronunciationStore()
+
+
+def format_ipa(output: str) -> str:
+    """Formats raw espeak-ng IPA output as a single /slash-delimited/ transcription."""
+    ipa_pronunciation = output.strip().replace("\n", " ").replace("  ", " ")
+    return f"/{ipa_pronunciation.strip('/')}/"
+
+
+class EspeakWorker:
+    """
+    A long-lived espeak-ng process that reads one line of text at a time from stdin.
+
+    The process is started on first use and restarted transparently if it
+    exits. If espeak-ng cannot be started at all or stops responding, the
+    worker marks itself unavailable and callers are expected to fall back to
+    one-off processes.
+    """
+
+    _stdout = subprocess.PIPE
+
+    def __init__(self, args: list[str]):
+        # Without a text argument espeak-ng reads stdin a line at a time. With
+        # --stdin it would read up to end of file before answering anything.
+        self._args = ["espeak-ng", *args]
+        self._process: subprocess.Popen | None = None
+        self._buffer = b""
+        self._lock = threading.Lock()
+        self.available = True
+
+    def _ensure_started(self) -> subprocess.Popen | None:
+        if self._process is not None and self._process.poll() is None:
+            return self._process
+        if self._process is not None:
+            utils.log_warning(f"espeak-ng worker exited (RC: {self._process.returncode}), restarting it.")
+        if not self.available:
+            return None
+
+        try:
+            self._process = subprocess.Popen(
+                self._args,
+                stdin=subprocess.PIPE,
+                stdout=self._stdout,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as ex:
+            utils.log_info(f"Could not start espeak-ng worker: {ex}")
+            self._process = None
+            self.available = False
+            return None
+        self._buffer = b""
+        return self._process
+
+    def _kill(self) -> None:
+        if self._process is not None:
+            self._process.kill()
+            self._process.wait()
+            self._process = None
+        self._buffer = b""
+
+    def _write_lines(self, lines: list[str]) -> bool:
+        process = self._ensure_started()
+        if process is None or process.stdin is None:
+            return False
+        try:
+            process.stdin.write("".join(f"{line}\n" for line in lines).encode("utf-8"))
+            process.stdin.flush()
+        except OSError:
+            self._kill()
+            return False
+        return True
+
+    def _read_line(self) -> str | None:
+        """Reads one line of output, giving up after WORKER_REPLY_TIMEOUT seconds."""
+        process = self._process
+        if process is None or process.stdout is None:
+            return None
+
+        fd = process.stdout.fileno()
+        deadline = time.monotonic() + WORKER_REPLY_TIMEOUT
+        while b"\n" not in self._buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                # A worker that stops answering would make every later term wait
+                # for the timeout too, so callers fall back to one-off processes.
+                utils.log_warning("espeak-ng worker did not reply in time, falling back to one-off processes.")
+                self._kill()
+                self.available = False
+                return None
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                self._kill()
+                return None
+            self._buffer += chunk
+
+        line, _, self._buffer = self._buffer.partition(b"\n")
+        return line.decode("utf-8", errors="replace")
+
+    def close(self) -> None:
+        """Stops the espeak-ng process."""
+        with self._lock:
+            if self._process is not None and self._process.stdin is not None:
+                try:
+                    self._process.stdin.close()
+                except OSError:
+                    pass
+            self._kill()
+
+
+class IpaWorker(EspeakWorker):
+    """An espeak-ng worker that transcribes terms to IPA, one line in and one line out."""
+
+    def __init__(self, accent: str):
+        super().__init__(["-v", f"en-{accent}", "--ipa=3", "-q"])
+        # espeak-ng writes IPA through stdio, which is block-buffered on a pipe,
+        # so replies would only arrive once the buffer fills. stdbuf makes it
+        # flush every line; without it the worker cannot be used.
+        stdbuf = shutil.which("stdbuf")
+        if stdbuf is None:
+            utils.log_info("stdbuf is not available, transcribing with one-off espeak-ng processes.")
+            self.available = False
+        else:
+            self._args = [stdbuf, "-oL", *self._args]
+
+    @staticmethod
+    def accepts(term: str) -> bool:
+        """Whether a term is guaranteed to produce exactly one line of IPA."""
+        return WORKER_TERM_PATTERN.fullmatch(term) is not None
+
+    def transcribe(self, term: str) -> str | None:
+        """Returns the IPA for a single term, or None if the worker could not transcribe it."""
+        return self.transcribe_many([term])[0]
+
+    def transcribe_many(self, terms: list[str]) -> list[str | None]:
+        """
+        Transcribes many terms in as few round trips as possible.
+
+        Terms are written in batches of WORKER_BATCH_SIZE so that neither side
+        of the pipe can fill up. A crashed worker is restarted once per batch.
+
+        Returns:
+            The formatted IPA for each term, in input order. Entries are None
+            for terms the worker does not accept or could not transcribe.
+        """
+        results: list[str | None] = [None] * len(terms)
+        pending = [index for index, term in enumerate(terms) if self.accepts(term)]
+
+        with self._lock:
+            for start in range(0, len(pending), WORKER_BATCH_SIZE):
+                batch = pending[start : start + WORKER_BATCH_SIZE]
+                for _attempt in range(2):
+                    replies = self._round_trip([terms[index] for index in batch])
+                    if replies is not None:
+                        for index, reply in zip(batch, replies, strict=True):
+                            results[index] = format_ipa(reply) if reply.strip() else None
+                        break
+                if not self.available:
+                    break
+        return results
+
+    def _round_trip(self, terms: list[str]) -> list[str] | None:
+        if not self._write_lines(terms):
+            return None
+        replies = []
+        for _term in terms:
+            reply = self._read_line()
+            if reply is None:
+                return None
+            replies.append(reply)
+        return replies
+
+
+class SpeechWorker(EspeakWorker):
+    """An espeak-ng worker that speaks each line of text it is given."""
+
+    _stdout = subprocess.DEVNULL
+
+    def __init__(self, accent: str, speed: int):
+        super().__init__(["-s", str(speed), "-v", f"en-{accent}"])
+
+    def speak(self, text: str) -> bool:
+        """Queues text to be spoken. Returns False if the worker is unavailable."""
+        line = " ".join(text.split())
+        if not line:
+            return True
+        with self._lock:
+            return self._write_lines([line]) or self._write_lines([line])
+
+
+_workers: dict[tuple, EspeakWorker] = {}
+_workers_lock = threading.Lock()
+
+
+def get_ipa_worker(accent: str) -> IpaWorker:
+    """Returns the shared IPA worker for an accent, creating it if needed."""
+    with _workers_lock:
+        worker = _workers.get(("ipa", accent))
+        if worker is None:
+            worker = _workers[("ipa", accent)] = IpaWorker(accent)
+        return worker  # type: ignore[return-value]
+
+
+def get_speech_worker(accent: str, speed: int) -> SpeechWorker:
+    """Returns the shared speech worker for an accent and speed, creating it if needed."""
+    with _workers_lock:
+        worker = _workers.get(("speech", accent, speed))
+        if worker is None:
+            worker = _workers[("speech", accent, speed)] = SpeechWorker(accent, speed)
+        return worker  # type: ignore[return-value]
+
+
+@atexit.register
+def shutdown_workers() -> None:
+    """Stops every espeak-ng worker process."""
+    with _workers_lock:
+        workers = list(_workers.values())
+        _workers.clear()
+    for worker in workers:
+        worker.close()
@@ -0,0 +1,247 @@
+# SPDX-FileCopyrightText: 2016-2025 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Persistent search history and favorites.
+
+The history used to be a list of at most 20 terms in wordbook.json. It now
+lives in an SQLite database in the data directory, without a size limit, and
+an in-memory index answers membership and favorite checks without touching
+the disk. The sidebar loads it a page at a time, most recent first.
+"""
+
+import os
+import sqlite3
+import threading
+
+from wordbook import utils
+
+HISTORY_DB_FILE: str = os.path.join(utils.DATA_DIR, "history.db")
+HISTORY_SCHEMA_VERSION = 1
+
+
+class HistoryStore:
+    """
+    Searched terms in order of last use, each of which may be a favorite.
+
+    Every term has a sequence number that grows with each use, so recency is
+    an indexed column rather than a position in a list. The whole table is
+    mirrored in a dict, which keeps is_favorite() and __contains__() O(1);
+    pages for display are read from the database. The connection is opened
+    lazily and guarded by a lock, so the store can be used from any thread.
+    """
+
+    def __init__(self, path: str = HISTORY_DB_FILE):
+        self._path = path
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+        # term -> (sequence number, is favorite)
+        self._index: dict[str, tuple[int, bool]] = {}
+        self._last_sequence = 0
+        self._favorite_count = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            connection = sqlite3.connect(self._path, timeout=5, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS history ("
+                " term TEXT PRIMARY KEY,"
+                " sequence INTEGER NOT NULL,"
+                " favorite INTEGER NOT NULL DEFAULT 0"
+                ") WITHOUT ROWID"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS history_by_sequence ON history (sequence)")
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS favorites_by_sequence ON history (sequence) WHERE favorite = 1"
+            )
+            connection.commit()
+
+            for term, sequence, favorite in connection.execute("SELECT term, sequence, favorite FROM history"):
+                self._index[term] = (sequence, bool(favorite))
+                self._last_sequence = max(self._last_sequence, sequence)
+                self._favorite_count += bool(favorite)
+            self._connection = connection
+        return self._connection
+
+    def import_legacy(self, history: list[str], favorites: list[str]) -> bool:
+        """
+        Imports the history and favorites kept in wordbook.json by earlier versions, once.
+
+        Args:
+            history: The saved history, most recent first.
+            favorites: The favorite terms.
+
+        Returns:
+            Whether they are in the store, now or from an earlier import, so they can be discarded.
+        """
+        with self._lock:
+            connection = self._connect()
+            (version,) = connection.execute("PRAGMA user_version").fetchone()
+            if version >= HISTORY_SCHEMA_VERSION:
+                return True
+
+            favorite_set = set(favorites)
+            # Favorites that were no longer in the history are kept, as the oldest entries.
+            terms = list(dict.fromkeys([*history, *favorites]))
+            rows = [(term, len(terms) - position, term in favorite_set) for position, term in enumerate(terms)]
+            try:
+                with connection:
+                    connection.executemany(
+                        "INSERT OR IGNORE INTO history (term, sequence, favorite) VALUES (?, ?, ?)", rows
+                    )
+                    connection.execute(f"PRAGMA user_version = {HISTORY_SCHEMA_VERSION}")
+            except sqlite3.Error as e:
+                utils.log_warning(f"Could not import the saved history: {e}")
+                return False
+
+            for term, sequence, favorite in rows:
+                if term not in self._index:
+                    self._index[term] = (sequence, favorite)
+                    self._favorite_count += favorite
+            self._last_sequence = max(self._last_sequence, len(terms))
+            utils.log_info(f"Imported {len(terms)} history entries from the settings file.")
+            return True
+
+    def __contains__(self, term: str) -> bool:
+        with self._lock:
+            self._connect()
+            return term in self._index
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._connect()
+            return len(self._index)
+
+    def count(self, favorites_only: bool = False) -> int:
+        """Returns the number of entries, or of favorites."""
+        with self._lock:
+            self._connect()
+            return self._favorite_count if favorites_only else len(self._index)
+
+    def is_favorite(self, term: str) -> bool:
+        """Whether a term is a favorite."""
+        with self._lock:
+            self._connect()
+            entry = self._index.get(term)
+            return entry is not None and entry[1]
+
+    def add(self, term: str) -> None:
+        """Records a use of a term, making it the most recent entry. Its favorite status is kept."""
+        with self._lock:
+            connection = self._connect()
+            entry = self._index.get(term)
+            favorite = entry is not None and entry[1]
+            self._last_sequence += 1
+            try:
+                with connection:
+                    connection.execute(
+                        "INSERT INTO history (term, sequence) VALUES (?, ?)"
+                        " ON CONFLICT (term) DO UPDATE SET sequence = excluded.sequence",
+                        (term, self._last_sequence),
+                    )
+            except sqlite3.Error as e:
+                utils.log_warning(f"Could not write history: {e}")
+                return
+            self._index[term] = (self._last_sequence, favorite)
+
+    def set_favorite(self, term: str, favorite: bool) -> None:
+        """Marks a term as a favorite or not, adding it to the history if needed."""
+        with self._lock:
+            connection = self._connect()
+            entry = self._index.get(term)
+            was_favorite = entry is not None and entry[1]
+            if entry is not None and was_favorite == favorite:
+                return
+            if entry is None:
+                self._last_sequence += 1
+                entry = (self._last_sequence, False)
+            try:
+                with connection:
+                    connection.execute(
+                        "INSERT INTO history (term, sequence, favorite) VALUES (?, ?, ?)"
+                        " ON CONFLICT (term) DO UPDATE SET favorite = excluded.favorite",
+                        (term, entry[0], favorite),
+                    )
+            except sqlite3.Error as e:
+                utils.log_warning(f"Could not write favorites: {e}")
+                return
+            self._index[term] = (entry[0], favorite)
+            self._favorite_count += int(favorite) - int(was_favorite)
+
+    def page(self, offset: int = 0, limit: int = 50, favorites_only: bool = False) -> list[tuple[str, bool]]:
+        """
+        Returns a page of entries, most recent first.
+
+        Args:
+            offset: The number of entries to skip.
+            limit: The maximum number of entries to return.
+            favorites_only: Only return favorites.
+
+        Returns:
+            (term, is favorite) pairs.
+        """
+        where = " WHERE favorite = 1" if favorites_only else ""
+        with self._lock:
+            try:
+                rows = (
+                    self._connect()
+                    .execute(
+                        f"SELECT term, favorite FROM history{where} ORDER BY sequence DESC LIMIT ? OFFSET ?",
+                        (limit, offset),
+                    )
+                    .fetchall()
+                )
+            except sqlite3.Error as e:
+                utils.log_warning(f"Could not read history: {e}")
+                return []
+        return [(term, bool(favorite)) for term, favorite in rows]
+
+    def clear(self) -> list[tuple[str, int]]:
+        """
+        Removes every entry that is not a favorite.
+
+        Returns:
+            The removed (term, sequence number) pairs, for restore().
+        """
+        with self._lock:
+            connection = self._connect()
+            removed = [(term, sequence) for term, (sequence, favorite) in self._index.items() if not favorite]
+            try:
+                with connection:
+                    connection.execute("DELETE FROM history WHERE favorite = 0")
+            except sqlite3.Error as e:
+                utils.log_warning(f"Could not clear history: {e}")
+                return []
+            for term, _sequence in removed:
+                del self._index[term]
+            return removed
+
+    def restore(self, entries: list[tuple[str, int]]) -> None:
+        """Puts back entries removed by clear(), unless they have been used again since."""
+        with self._lock:
+            connection = self._connect()
+            entries = [(term, sequence) for term, sequence in entries if term not in self._index]
+            try:
+                with connection:
+                    connection.executemany("INSERT INTO history (term, sequence) VALUES (?, ?)", entries)
+            except sqlite3.Error as e:
+                utils.log_warning(f"Could not restore history: {e}")
+                return
+            for term, sequence in entries:
+                self._index[term] = (sequence, False)
+
+    def close(self) -> None:
+        """Closes the database connection. The store reopens it if used again."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+                self._index.clear()
+                self._last_sequence = 0
+                self._favorite_count = 0
+
+
+HISTORY_STORE = HistoryStore()
@@ -0,0 +1,162 @@
+# SPDX-FileCopyrightText: 2016-2025 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+In-memory indexes over the WordNet wordlist, used for completions and
+spelling suggestions.
+"""
+
+import time
+from bisect import bisect_left
+from collections import Counter
+
+
+def display_lemma(lemma: str) -> str:
+    """Converts a raw WordNet lemma into the form shown to the user."""
+    return lemma.replace("_", " ").strip()
+
+
+class PrefixIndex:
+    """
+    A sorted, case-folded view of the wordlist.
+
+    Prefix queries are answered with a binary search followed by a short
+    forward walk, so a completion costs O(log n + k) instead of a scan over
+    the whole wordlist. Results come back in case-folded alphabetical order,
+    which keeps the top-k stable between keystrokes.
+    """
+
+    def __init__(self, lemmas: list[str]):
+        # dict.fromkeys() deduplicates without disturbing the input order, so an
+        # already sorted wordlist (e.g. one read back from the cache) sorts in
+        # linear time.
+        words = dict.fromkeys(display_lemma(lemma) for lemma in lemmas)
+        words.pop("", None)
+        self._words: list[str] = sorted(words, key=lambda word: (word.casefold(), word))
+        self._keys: list[str] = [word.casefold() for word in self._words]
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    @property
+    def words(self) -> list[str]:
+        """The indexed words, in index order."""
+        return self._words
+
+    def complete(self, prefix: str, limit: int = 10) -> list[str]:
+        """
+        Returns up to `limit` words starting with `prefix`, ignoring case.
+
+        Args:
+            prefix: The text typed so far.
+            limit: The maximum number of completions to return.
+
+        Returns:
+            The matching words in case-folded alphabetical order.
+        """
+        key = prefix.casefold()
+        start = bisect_left(self._keys, key)
+        end = min(start + limit, len(self._keys))
+
+        completions = []
+        for position in range(start, end):
+            if not self._keys[position].startswith(key):
+                break
+            completions.append(self._words[position])
+        return completions
+
+
+def _trigrams(key: str) -> set[str]:
+    padded = f"  {key} "
+    return {padded[position : position + 3] for position in range(len(padded) - 2)}
+
+
+class FuzzyIndex:
+    """
+    A trigram inverted index for finding words within a small edit distance.
+
+    A word within edit distance d of the query shares all but at most 3d of
+    the query's trigrams, so only words sharing enough trigrams are checked
+    with a real Levenshtein distance. That keeps a lookup to a few hundred
+    comparisons instead of one per word in the wordlist.
+    """
+
+    def __init__(self, words: list[str]):
+        # rapidfuzz is only needed once there is a wordlist to search, so it
+        # is imported here, on the worker thread building the index, rather
+        # than at startup.
+        from rapidfuzz.distance import Levenshtein
+
+        self._distance = Levenshtein.distance
+        # Word ids are assigned in order of length, so every posting list is
+        # sorted by length too and the length filter becomes two bisections.
+        self._words: list[str] = sorted(words, key=len)
+        self._keys: list[str] = [word.casefold() for word in self._words]
+        self._length_offsets: list[int] = []
+        postings: dict[str, list[int]] = {}
+        for word_id, key in enumerate(self._keys):
+            while len(self._length_offsets) <= len(key):
+                self._length_offsets.append(word_id)
+            for trigram in _trigrams(key):
+                postings.setdefault(trigram, []).append(word_id)
+        self._length_offsets.append(len(self._keys))
+        self._postings = postings
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def _id_range(self, min_length: int, max_length: int) -> tuple[int, int]:
+        last = len(self._length_offsets) - 1
+        return (
+            self._length_offsets[min(max(min_length, 0), last)],
+            self._length_offsets[min(max_length + 1, last)],
+        )
+
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        max_distance: int | None = None,
+        deadline: float | None = None,
+    ) -> list[str]:
+        """
+        Returns up to `limit` words within `max_distance` edits of `query`, ignoring case.
+
+        Args:
+            query: The (possibly misspelled) text to match.
+            limit: The maximum number of words to return.
+            max_distance: The largest edit distance to accept. Defaults to 1 for
+                short queries and 2 for longer ones.
+            deadline: A time.monotonic() value after which candidates stop being
+                checked and the best matches found so far are returned.
+
+        Returns:
+            The matching words, closest first.
+        """
+        key = query.casefold().strip()
+        if not key:
+            return []
+        if max_distance is None:
+            max_distance = 1 if len(key) <= 5 else 2
+
+        query_trigrams = _trigrams(key)
+        first_id, end_id = self._id_range(len(key) - max_distance, len(key) + max_distance)
+        overlaps: Counter[int] = Counter()
+        for trigram in query_trigrams:
+            posting = self._postings.get(trigram)
+            if posting:
+                overlaps.update(posting[bisect_left(posting, first_id) : bisect_left(posting, end_id)])
+
+        min_overlap = max(1, len(query_trigrams) - 3 * max_distance)
+        matches: list[tuple[int, int, str]] = []
+        for word_id, overlap in overlaps.most_common():
+            if overlap < min_overlap:
+                break
+            if deadline is not None and time.monotonic() > deadline:
+                break
+            distance = self._distance(key, self._keys[word_id], score_cutoff=max_distance)
+            if distance <= max_distance:
+                matches.append((distance, -overlap, self._words[word_id]))
+
+        matches.sort()
+        return [word for _distance, _overlap, word in matches[:limit]]
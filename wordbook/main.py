@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: 2016-2025 Mufeed Ali <me@mufeed.dev>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import time
 from gettext import gettext as _
 
 import gi
@@ -11,8 +12,10 @@ gi.require_version("Adw", "1")
 from gi.repository import Adw, Gio, GLib, Gtk  # noqa
 
 from wordbook import base, utils  # noqa
+from wordbook.history import HISTORY_STORE  # noqa
 from wordbook.window import WordbookWindow  # noqa
 from wordbook.settings import Settings  # noqa
+from wordbook.timing import LOOKUP_STATS  # noqa
 
 
 class Application(Adw.Application):
@@ -21,6 +24,9 @@ class Application(Adw.Application):
     app_id: str = ""
     development_mode: bool = False
     version: str = "0.0.0"
+    # time.monotonic() when the launcher started, for --profile-startup
+    start_time: float = time.monotonic()
+    profile_startup: bool = False
 
     lookup_term: str | None = None
     auto_paste_requested: bool = False
@@ -37,6 +43,7 @@ class Application(Adw.Application):
 
         self.app_id = app_id
         self.version = version
+        self._startup_milestones: set[str] = set()
 
         self.add_main_option(
             "look-up",
@@ -70,6 +77,14 @@ class Application(Adw.Application):
             "Automatically paste and search clipboard content",
             None,
         )
+        self.add_main_option(
+            "profile-startup",
+            0,
+            GLib.OptionFlags.NONE,
+            GLib.OptionArg.NONE,
+            "Print how long startup takes until the window is shown and until search is ready",
+            None,
+        )
 
         Adw.StyleManager.get_default().set_color_scheme(
             Adw.ColorScheme.FORCE_DARK if Settings.get().gtk_dark_ui else Adw.ColorScheme.PREFER_LIGHT
@@ -82,6 +97,13 @@ class Application(Adw.Application):
         self.set_resource_base_path(utils.RES_PATH)
         Adw.Application.do_startup(self)
 
+    def do_shutdown(self):
+        """GApplication lifecycle method, called once the application is done. Writes unsaved state to disk."""
+        Settings.get().flush()
+        HISTORY_STORE.close()
+        LOOKUP_STATS.report()
+        Adw.Application.do_shutdown(self)
+
     def do_activate(self):
         """
         The main entry point for when the application is launched.
@@ -97,9 +119,30 @@ class Application(Adw.Application):
                 auto_paste_requested=self.auto_paste_requested,
             )
             self.setup_actions()
+            if self.profile_startup:
+                self.win.add_tick_callback(self._on_first_frame)
 
         self.win.present()
 
+    def _on_first_frame(self, _window, _frame_clock):
+        """Tick callback for the first frame of the main window."""
+        self.report_startup_time("window presented")
+        return GLib.SOURCE_REMOVE
+
+    def report_startup_time(self, milestone: str) -> None:
+        """
+        Prints the time elapsed since launch when --profile-startup is given.
+
+        Each milestone is only reported the first time it is reached.
+
+        Args:
+            milestone: A short description of the startup stage that was reached.
+        """
+        if not self.profile_startup or milestone in self._startup_milestones:
+            return
+        self._startup_milestones.add(milestone)
+        print(f"{milestone}: {(time.monotonic() - self.start_time) * 1000:.1f} ms", flush=True)
+
     def do_command_line(self, command_line):
         """
         Handles command-line argument parsing. This can be called before do_activate().
@@ -123,6 +166,9 @@ class Application(Adw.Application):
         if "auto-paste" in options:
             self.auto_paste_requested = True
 
+        if "profile-startup" in options:
+            self.profile_startup = True
+
         utils.log_init(self.development_mode or "verbose" in options or False)
 
         if self.win is not None:
@@ -179,3 +225,4 @@ class Application(Adw.Application):
         self.set_accels_for_action("win.preferences", ["<Primary>comma"])
         self.set_accels_for_action("win.toggle-sidebar", ["F9"])
         self.set_accels_for_action("win.toggle-menu", ["F10"])
+        self.set_accels_for_action("win.lookup-stats", ["<Primary><Shift>d"])
@@ -0,0 +1,152 @@
+# SPDX-FileCopyrightText: 2016-2025 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+A reverse dictionary: finds words by what their definitions say.
+
+The index is an SQLite database with an FTS5 table over the definition and
+examples of every synset of a lexicon, stemmed with the Porter stemmer, next
+to the synset records (see wordbook.snapshot) that results are shown from.
+It is built once per lexicon and wn.db modification time, like the snapshot,
+so a query never touches wn.db.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+from typing import Any
+
+from wordbook import utils
+from wordbook.snapshot import lexicon_rowid, read_synset_records
+
+REVERSE_INDEX_SCHEMA_VERSION = "1"
+
+# Matches in a definition count for more than matches in an example sentence.
+DEFINITION_WEIGHT = 4.0
+EXAMPLE_WEIGHT = 1.0
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+class ReverseIndex:
+    """A full-text index over the definitions of a lexicon. Queries are safe from any thread."""
+
+    def __init__(self, path: str, key: tuple[str, str]):
+        """
+        Opens a reverse index.
+
+        Raises:
+            FileNotFoundError: If the index has not been built.
+            sqlite3.Error: If the file cannot be read.
+            ValueError: If the index was built for another database or by another version.
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(path)
+        self._connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+        self._lock = threading.Lock()
+        try:
+            meta = dict(self._connection.execute("SELECT key, value FROM meta"))
+        except sqlite3.Error:
+            self._connection.close()
+            raise
+        if (meta.get("schema"), meta.get("lexicon"), meta.get("mtime")) != (REVERSE_INDEX_SCHEMA_VERSION, *key):
+            self._connection.close()
+            raise ValueError("Reverse index does not match the current WordNet database.")
+        self.key = key
+
+    def search(self, query: str, limit: int = 30) -> list[list[Any]]:
+        """
+        Finds the synsets whose definition or examples contain the words of a query, best match first.
+
+        Synsets containing every word are preferred. If there are none, synsets
+        containing any of the words are returned instead.
+
+        Args:
+            query: Free text, e.g. "fear of heights".
+            limit: The maximum number of synsets to return.
+
+        Returns:
+            [pos, lemmas, definition, examples, antonyms, similar, also] per synset.
+        """
+        words = list(dict.fromkeys(_WORD_PATTERN.findall(query.lower())))
+        if not words:
+            return []
+
+        # Every word is quoted, so FTS5 operators and column filters in the query are taken literally.
+        phrases = [f'"{word}"' for word in words]
+        rows = self._match(" ".join(phrases), limit)
+        if not rows and len(phrases) > 1:
+            rows = self._match(" OR ".join(phrases), limit)
+        return [json.loads(record) for (record,) in rows]
+
+    def _match(self, expression: str, limit: int) -> list[tuple[str]]:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT r.record FROM glosses JOIN records AS r ON r.rowid = glosses.rowid"
+                " WHERE glosses MATCH ? ORDER BY bm25(glosses, ?, ?) LIMIT ?",
+                (expression, DEFINITION_WEIGHT, EXAMPLE_WEIGHT, limit),
+            ).fetchall()
+
+    def close(self) -> None:
+        """Closes the index. Queries must not be running."""
+        self._connection.close()
+
+
+def build_reverse_index(db_path: str, lexicon: str, key: tuple[str, str], path: str) -> None:
+    """
+    Builds the reverse index of one lexicon from wn.db.
+
+    The database is written next to its final location and moved into place,
+    so readers never see a partial index.
+
+    Args:
+        db_path: Path to wn.db.
+        lexicon: The lexicon specifier, e.g. "oewn:2024".
+        key: The (lexicon, wn.db mtime) pair the index is valid for.
+        path: Where to write the index.
+    """
+    connection = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        rowid = lexicon_rowid(connection, lexicon)
+        synset_rowids = [
+            synset_rowid
+            for (synset_rowid,) in connection.execute(
+                "SELECT rowid FROM synsets WHERE lexicon_rowid = ? ORDER BY rowid", (rowid,)
+            )
+        ]
+        records = read_synset_records(connection, rowid, synset_rowids)
+    finally:
+        connection.close()
+
+    temp_path = f"{path}.tmp"
+    if os.path.exists(temp_path):
+        os.remove(temp_path)
+    index = sqlite3.connect(temp_path)
+    try:
+        index.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        index.execute("CREATE TABLE records (rowid INTEGER PRIMARY KEY, record TEXT NOT NULL)")
+        index.execute("CREATE VIRTUAL TABLE glosses USING fts5(definition, examples, tokenize = 'porter unicode61')")
+        index.executemany(
+            "INSERT INTO meta (key, value) VALUES (?, ?)",
+            [("schema", REVERSE_INDEX_SCHEMA_VERSION), ("lexicon", key[0]), ("mtime", key[1])],
+        )
+        indexed = [(number, record) for number, record in enumerate(records) if record[1] and record[2]]
+        index.executemany(
+            "INSERT INTO records (rowid, record) VALUES (?, ?)",
+            (
+                (number, json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+                for number, record in indexed
+            ),
+        )
+        index.executemany(
+            "INSERT INTO glosses (rowid, definition, examples) VALUES (?, ?, ?)",
+            ((number, record[2], "\n".join(record[3])) for number, record in indexed),
+        )
+        index.execute("INSERT INTO glosses (glosses) VALUES ('optimize')")
+        index.commit()
+    finally:
+        index.close()
+    os.replace(temp_path, path)
+    utils.log_info(f"Reverse index written with {len(indexed)} definitions.")
@@ -3,8 +3,10 @@
 
 from __future__ import annotations
 
+import atexit
 import json
 import os
+import threading
 from enum import Enum
 from pathlib import Path
 from typing import Any
@@ -13,6 +15,9 @@ from pydantic import BaseModel, Field, field_validator
 
 from wordbook import utils
 
+# Changes made within this many seconds of the first unsaved one are written to disk together.
+SAVE_DELAY = 0.5
+
 
 class PronunciationAccent(Enum):
     """Enumeration of supported pronunciation accents."""
@@ -72,18 +77,12 @@ class AppearanceSettings(BaseModel):
 class StateSettings(BaseModel):
     """State settings."""
 
+    # Kept in the history store since; only read to import what earlier versions saved.
     history: list[str] = Field(default_factory=list, description="Search history")
     favorites: list[str] = Field(default_factory=list, description="Favorite search terms")
     window_width: int = Field(default=400, description="Window width")
     window_height: int = Field(default=600, description="Window height")
 
-    @field_validator("history")
-    @classmethod
-    def validate_history(cls, v: list[str]) -> list[str]:
-        """Validate and limit history size."""
-        # Keep only last 20 items
-        return v[-20:] if len(v) > 20 else v
-
 
 class WordbookSettings(BaseModel):
     """Main settings model for Wordbook application."""
@@ -105,6 +104,13 @@ class Settings:
         self._autosave_disabled = True
         self._config_file: Path = Path(utils.CONFIG_DIR) / "wordbook.json"
 
+        # Write-behind state: the latest unsaved settings and the timer that will write them.
+        self._pending_save: dict[str, Any] | None = None
+        self._save_timer: threading.Timer | None = None
+        self._save_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        atexit.register(self.flush)
+
         # Ensure config directory exists
         os.makedirs(utils.CONFIG_DIR, exist_ok=True)
 
@@ -151,10 +157,49 @@ class Settings:
             self._save_settings()
 
     def _save_settings(self) -> None:
-        """Save settings to JSON file."""
+        """
+        Schedule the current settings to be saved to the JSON file.
+
+        The settings are captured right away, but written on a background
+        thread SAVE_DELAY seconds later, so a burst of changes results in a
+        single write and the caller never waits for the disk.
+        """
+        data = self._settings.model_dump()
+        with self._save_lock:
+            self._pending_save = data
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(SAVE_DELAY, self._write_pending)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    def flush(self) -> None:
+        """Write any unsaved settings now. Runs automatically when the process exits."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+        self._write_pending()
+
+    def _write_pending(self) -> None:
+        """Write the latest unsaved settings, if any."""
+        # Taking the data under the write lock guarantees that a newer
+        # snapshot is never overwritten by an older one still being written.
+        with self._write_lock:
+            with self._save_lock:
+                data = self._pending_save
+                self._pending_save = None
+                self._save_timer = None
+            if data is not None:
+                self._write_settings(data)
+
+    def _write_settings(self, data: dict[str, Any]) -> None:
+        """Save settings to the JSON file atomically, so a crash never leaves it half-written."""
+        temp_file = self._config_file.with_name(f"{self._config_file.name}.tmp")
         try:
-            with open(self._config_file, "w") as f:
-                json.dump(self._settings.model_dump(), f, indent=4)
+            with open(temp_file, "w") as f:
+                json.dump(data, f, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self._config_file)
             utils.log_debug("Settings saved successfully")
         except Exception as e:
             utils.log_error(f"Failed to save settings: {e}")
@@ -218,43 +263,16 @@ class Settings:
 
     # State settings properties
     @property
-    def history(self) -> list[str]:
-        """Get search history."""
-        return self._settings.state.history.copy()
-
-    @history.setter
-    def history(self, value: list[str]) -> None:
-        """Set search history."""
-        # Validate and limit history
-        self._settings.state.history = value[-20:] if len(value) > 20 else value
-
-    def clear_history(self) -> None:
-        """Clear search history."""
-        self._settings.state.history = []
-
-    @property
-    def favorites(self) -> list[str]:
-        """Get favorites."""
-        return self._settings.state.favorites.copy()
-
-    @favorites.setter
-    def favorites(self, value: list[str]) -> None:
-        """Set favorites."""
-        self._settings.state.favorites = value
-
-    def add_favorite(self, term: str) -> None:
-        """Add a term to favorites."""
-        if term not in self._settings.state.favorites:
-            self._settings.state.favorites.append(term)
-
-    def remove_favorite(self, term: str) -> None:
-        """Remove a term from favorites."""
-        if term in self._settings.state.favorites:
-            self._settings.state.favorites.remove(term)
-
-    def is_favorite(self, term: str) -> bool:
-        """Check if a term is favorited."""
-        return term in self._settings.state.favorites
+    def legacy_history(self) -> tuple[list[str], list[str]]:
+        """Get the search history (most recent first) and favorites saved by earlier versions."""
+        return self._settings.state.history.copy(), self._settings.state.favorites.copy()
+
+    def clear_legacy_history(self) -> None:
+        """Remove the legacy search history and favorites once they have been imported."""
+        if self._settings.state.history or self._settings.state.favorites:
+            self._settings.state.history = []
+            self._settings.state.favorites = []
+            self._save_settings()
 
     @property
     def window_width(self) -> int:
@@ -0,0 +1,298 @@
+# SPDX-FileCopyrightText: 2016-2025 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+A compact, read-only snapshot of a WordNet lexicon.
+
+The snapshot holds everything get_definition() needs (lemmas, definitions,
+examples, antonyms, similar terms and "also see" relations) in one flat file
+that is memory-mapped and binary-searched, so a lookup does no SQL at all.
+
+File layout (integers are little-endian unsigned 64-bit):
+
+    header      b"WBSN1\\t<lexicon>\\t<wn.db mtime>\\t<key count>\\t<synset count>\\n"
+    key table   key count + 1 offsets, one per key record, sorted by key
+    synset table  synset count + 1 offsets, one per synset record
+    key records   b"<key>\\0<JSON list of synset numbers>"
+    synset records  JSON [pos, lemmas, definition, examples, antonyms, similar, also]
+"""
+
+import json
+import mmap
+import os
+import sqlite3
+import struct
+import unicodedata
+from typing import Any
+
+from wordbook import utils
+
+SNAPSHOT_MAGIC = "WBSN1"
+_OFFSET = struct.Struct("<Q")
+
+
+def normalize_form(form: str) -> str:
+    """Lowercases a form and strips diacritics, the way wn normalizes forms."""
+    return "".join(c for c in unicodedata.normalize("NFKD", form.lower()) if not unicodedata.combining(c))
+
+
+class LexiconSnapshot:
+    """A memory-mapped snapshot file. Lookups are safe from any thread."""
+
+    def __init__(self, path: str, key: tuple[str, str]):
+        """
+        Opens a snapshot file.
+
+        Raises:
+            OSError: If the file cannot be read.
+            ValueError: If the file is malformed or was built for another database.
+        """
+        with open(path, "rb") as snapshot_file:
+            self._mmap = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        header_end = self._mmap.find(b"\n")
+        fields = self._mmap[:header_end].decode("utf-8").split("\t") if header_end > 0 else []
+        if len(fields) != 5 or fields[0] != SNAPSHOT_MAGIC or (fields[1], fields[2]) != key:
+            self._mmap.close()
+            raise ValueError("Snapshot does not match the current WordNet database.")
+
+        self.key = key
+        self._key_count = int(fields[3])
+        self._synset_count = int(fields[4])
+        self._key_table = header_end + 1
+        self._synset_table = self._key_table + (self._key_count + 1) * _OFFSET.size
+
+    def __len__(self) -> int:
+        return self._key_count
+
+    def _offset(self, table: int, index: int) -> int:
+        return _OFFSET.unpack_from(self._mmap, table + index * _OFFSET.size)[0]
+
+    def _find_key(self, key: bytes) -> int | None:
+        low, high = 0, self._key_count
+        while low < high:
+            middle = (low + high) // 2
+            start = self._offset(self._key_table, middle)
+            candidate = self._mmap[start : self._mmap.find(b"\0", start)]
+            if candidate < key:
+                low = middle + 1
+            elif candidate > key:
+                high = middle
+            else:
+                return middle
+        return None
+
+    def synsets(self, form: str) -> list[list[Any]]:
+        """
+        Returns the synset records for a word form, in WordNet's order.
+
+        Each record is [pos, lemmas, definition, examples, antonyms, similar, also].
+        Like wn.Wordnet.synsets(), the form is matched against both the stored
+        and the normalized forms, then retried normalized if nothing matched.
+        """
+        index = self._find_key(form.encode("utf-8"))
+        if index is None:
+            index = self._find_key(normalize_form(form).encode("utf-8"))
+        if index is None:
+            return []
+        start = self._offset(self._key_table, index)
+        end = self._offset(self._key_table, index + 1)
+        separator = self._mmap.find(b"\0", start, end)
+        return [self._synset(number) for number in json.loads(self._mmap[separator + 1 : end])]
+
+    def _synset(self, number: int) -> list[Any]:
+        start = self._offset(self._synset_table, number)
+        end = self._offset(self._synset_table, number + 1)
+        return json.loads(self._mmap[start:end])
+
+    def close(self) -> None:
+        """Unmaps the file. Lookups must not be running."""
+        self._mmap.close()
+
+
+def build_snapshot(db_path: str, lexicon: str, key: tuple[str, str], path: str) -> None:
+    """
+    Builds a snapshot of one lexicon from wn.db with a handful of whole-table queries.
+
+    The file is written next to its final location and moved into place, so
+    readers never see a partial snapshot.
+
+    Args:
+        db_path: Path to wn.db.
+        lexicon: The lexicon specifier, e.g. "oewn:2024".
+        key: The (lexicon, wn.db mtime) pair the snapshot is valid for.
+        path: Where to write the snapshot.
+    """
+    connection = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        synsets, keys = _read_lexicon(connection, lexicon_rowid(connection, lexicon))
+    finally:
+        connection.close()
+
+    synset_blobs = [json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8") for record in synsets]
+    key_blobs = [
+        key_text + b"\0" + json.dumps(numbers, separators=(",", ":")).encode("utf-8")
+        for key_text, numbers in sorted((form.encode("utf-8"), numbers) for form, numbers in keys.items())
+    ]
+
+    header = "\t".join([SNAPSHOT_MAGIC, key[0], key[1], str(len(key_blobs)), str(len(synset_blobs))]) + "\n"
+    position = len(header.encode("utf-8")) + (len(key_blobs) + len(synset_blobs) + 2) * _OFFSET.size
+    key_offsets = []
+    for blob in key_blobs:
+        key_offsets.append(position)
+        position += len(blob)
+    key_offsets.append(position)
+    synset_offsets = []
+    for blob in synset_blobs:
+        synset_offsets.append(position)
+        position += len(blob)
+    synset_offsets.append(position)
+
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as snapshot_file:
+        snapshot_file.write(header.encode("utf-8"))
+        snapshot_file.write(struct.pack(f"<{len(key_offsets)}Q", *key_offsets))
+        snapshot_file.write(struct.pack(f"<{len(synset_offsets)}Q", *synset_offsets))
+        snapshot_file.writelines(key_blobs)
+        snapshot_file.writelines(synset_blobs)
+    os.replace(temp_path, path)
+    utils.log_info(f"Lexicon snapshot written with {len(key_blobs)} forms and {len(synset_blobs)} synsets.")
+
+
+def lexicon_rowid(connection: sqlite3.Connection, lexicon: str) -> int:
+    """
+    Returns the database rowid of a lexicon.
+
+    Raises:
+        ValueError: If the lexicon is not installed.
+    """
+    lexicon_id, _, version = lexicon.partition(":")
+    row = connection.execute(
+        "SELECT rowid FROM lexicons WHERE id = ? AND version = ?", (lexicon_id, version)
+    ).fetchone()
+    if row is None:
+        raise ValueError(f"Lexicon {lexicon} is not installed.")
+    return row[0]
+
+
+def read_synset_records(
+    connection: sqlite3.Connection, lexicon_rowid: int, synset_rowids: list[int]
+) -> list[list[Any]]:
+    """
+    Reads the snapshot records of many synsets with a fixed number of set-based queries.
+
+    This fetches the same data that Synset.lemmas(), definition(), examples(),
+    Sense.get_related("antonym") and Synset.get_related("similar" / "also")
+    would, without a round trip per synset, sense or relation.
+
+    Args:
+        connection: A connection to wn.db.
+        lexicon_rowid: The rowid of the lexicon the synsets and relations belong to.
+        synset_rowids: The synsets to read.
+
+    Returns:
+        One [pos, lemmas, definition, examples, antonyms, similar, also] record
+        per synset, in the order of `synset_rowids`.
+    """
+
+    def normalize(lemma: str) -> str:
+        return lemma.replace("_", " ").strip()
+
+    wanted = json.dumps(synset_rowids)
+    records: dict[int, list[Any]] = {rowid: [None, [], None, [], [], [], []] for rowid in synset_rowids}
+
+    for synset_rowid, pos in connection.execute(
+        "SELECT rowid, pos FROM synsets WHERE rowid IN (SELECT value FROM json_each(?))", (wanted,)
+    ):
+        records[synset_rowid][0] = pos
+
+    for synset_rowid, definition in connection.execute(
+        "SELECT synset_rowid, definition FROM definitions"
+        " WHERE synset_rowid IN (SELECT value FROM json_each(?)) AND lexicon_rowid = ? ORDER BY rowid",
+        (wanted, lexicon_rowid),
+    ):
+        record = records[synset_rowid]
+        if record[2] is None:
+            record[2] = definition
+
+    for synset_rowid, example in connection.execute(
+        "SELECT synset_rowid, example FROM synset_examples"
+        " WHERE synset_rowid IN (SELECT value FROM json_each(?)) AND lexicon_rowid = ? ORDER BY rowid",
+        (wanted, lexicon_rowid),
+    ):
+        records[synset_rowid][3].append(example)
+
+    for synset_rowid, antonym in connection.execute(
+        "SELECT src.synset_rowid, f.form FROM senses AS src"
+        " JOIN sense_relations AS r ON r.source_rowid = src.rowid"
+        " JOIN relation_types AS t ON t.rowid = r.type_rowid"
+        " JOIN senses AS tgt ON tgt.rowid = r.target_rowid"
+        " JOIN forms AS f ON f.entry_rowid = tgt.entry_rowid AND f.rank = 0"
+        " WHERE src.synset_rowid IN (SELECT value FROM json_each(?)) AND r.lexicon_rowid = ?"
+        " AND t.type = 'antonym'"
+        " ORDER BY src.synset_rowid, src.synset_rank, r.rowid",
+        (wanted, lexicon_rowid),
+    ):
+        antonyms = records[synset_rowid][4]
+        if normalize(antonym) not in antonyms:
+            antonyms.append(normalize(antonym))
+
+    related = connection.execute(
+        "SELECT r.source_rowid, t.type, r.target_rowid FROM synset_relations AS r"
+        " JOIN relation_types AS t ON t.rowid = r.type_rowid"
+        " JOIN synsets AS tgt ON tgt.rowid = r.target_rowid"
+        " WHERE r.source_rowid IN (SELECT value FROM json_each(?)) AND r.lexicon_rowid = ?"
+        " AND tgt.lexicon_rowid = ? AND t.type IN ('similar', 'also')"
+        " ORDER BY r.rowid",
+        (wanted, lexicon_rowid, lexicon_rowid),
+    ).fetchall()
+
+    # Lemmas are read for the synsets and the targets of their relations at once.
+    lemmas: dict[int, list[str]] = {}
+    for synset_rowid, lemma in connection.execute(
+        "SELECT s.synset_rowid, f.form FROM senses AS s"
+        " JOIN forms AS f ON f.entry_rowid = s.entry_rowid AND f.rank = 0"
+        " WHERE s.synset_rowid IN (SELECT value FROM json_each(?))"
+        " ORDER BY s.synset_rowid, s.synset_rank, s.rowid",
+        (json.dumps([*synset_rowids, *(target for _, _, target in related)]),),
+    ):
+        lemmas.setdefault(synset_rowid, []).append(lemma)
+
+    for synset_rowid, record in records.items():
+        record[1] = lemmas.get(synset_rowid, [])
+    for source_rowid, relation, target_rowid in related:
+        records[source_rowid][5 if relation == "similar" else 6].extend(
+            normalize(lemma) for lemma in lemmas.get(target_rowid, [])
+        )
+
+    return [records[rowid] for rowid in synset_rowids]
+
+
+def _read_lexicon(connection: sqlite3.Connection, lexicon_rowid: int) -> tuple[list[list[Any]], dict[str, list[int]]]:
+    """Reads every synset of a lexicon and the forms that lead to them."""
+    synset_rowids = [
+        rowid
+        for (rowid,) in connection.execute(
+            "SELECT rowid FROM synsets WHERE lexicon_rowid = ? ORDER BY rowid", (lexicon_rowid,)
+        )
+    ]
+    numbers = {rowid: number for number, rowid in enumerate(synset_rowids)}
+    synsets = read_synset_records(connection, lexicon_rowid, synset_rowids)
+
+    # wn matches a form against both the stored and the normalized column and
+    # orders the synsets by entry, then by the sense's rank within the entry.
+    matches: dict[str, list[tuple[int, int, int]]] = {}
+    for form, normalized_form, entry_rowid, entry_rank, synset_rowid in connection.execute(
+        "SELECT f.form, f.normalized_form, s.entry_rowid, s.entry_rank, s.synset_rowid FROM forms AS f"
+        " JOIN senses AS s ON s.entry_rowid = f.entry_rowid WHERE f.lexicon_rowid = ?",
+        (lexicon_rowid,),
+    ):
+        if synset_rowid not in numbers:
+            continue
+        sort_key = (entry_rowid, entry_rank or 0, numbers[synset_rowid])
+        matches.setdefault(form, []).append(sort_key)
+        if normalized_form and normalized_form != form:
+            matches.setdefault(normalized_form, []).append(sort_key)
+
+    keys = {form: list(dict.fromkeys(number for *_, number in sorted(found))) for form, found in matches.items()}
+    return synsets, keys
@@ -0,0 +1,187 @@
+# SPDX-FileCopyrightText: 2016-2025 Mufeed Ali <me@mufeed.dev>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Per-stage timing of lookups.
+
+The lookup path in wordbook.base records how long each stage took (cleaning
+the input, waiting for the database lock, finding synsets, reading their
+relations, matching lemmas, transcribing the pronunciation) into a rolling
+histogram per stage. The summaries are logged every LOG_INTERVAL lookups when
+running with --verbose, shown by the window's lookup statistics action and
+written to STATS_FILE when the application shuts down.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from typing import Any
+
+from wordbook import utils
+
+STATS_FILE: str = os.path.join(utils.DATA_DIR, "lookup-stats.json")
+
+# Stage names. LOOKUP covers a whole definition lookup, including cache hits.
+CLEAN = "clean"
+LOCK_WAIT = "lock_wait"
+SYNSET_QUERY = "synset_query"
+RELATIONS = "relations"
+LEMMA_MATCH = "lemma_match"
+PRONUNCIATION = "pronunciation"
+REVERSE_LOOKUP = "reverse_lookup"
+LOOKUP = "lookup"
+
+# Each histogram summarizes this many of the most recent samples.
+ROLLING_WINDOW = 1024
+
+# Number of lookups between logged summaries.
+LOG_INTERVAL = 100
+
+# Upper bounds of the histogram buckets, in milliseconds. Slower samples go in a last, unbounded bucket.
+BUCKET_BOUNDS_MS = (0.01, 0.1, 1.0, 10.0, 100.0, 1000.0)
+
+
+class RollingHistogram:
+    """The durations of the most recent samples of one stage, and totals over all of them. Not thread-safe."""
+
+    def __init__(self, size: int = ROLLING_WINDOW):
+        self._samples: deque[float] = deque(maxlen=size)
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, seconds: float) -> None:
+        """Adds a sample, dropping the oldest one if the window is full."""
+        self._samples.append(seconds)
+        self.count += 1
+        self.total += seconds
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Summarizes the histogram. Times are in milliseconds.
+
+        Returns:
+            The total 'count' and 'total_ms', and the 'p50_ms', 'p95_ms',
+            'p99_ms', 'max_ms' and bucket counts ('buckets', keyed by upper
+            bound) of the samples in the window.
+        """
+        samples = sorted(sample * 1000 for sample in self._samples)
+        if not samples:
+            return {"count": self.count, "total_ms": self.total * 1000}
+
+        def percentile(fraction: float) -> float:
+            return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+        buckets = {f"<={bound:g}": 0 for bound in BUCKET_BOUNDS_MS}
+        buckets["inf"] = 0
+        labels = list(buckets)
+        for sample in samples:
+            buckets[labels[bisect_left(BUCKET_BOUNDS_MS, sample)]] += 1
+
+        return {
+            "count": self.count,
+            "total_ms": self.total * 1000,
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+            "p99_ms": percentile(0.99),
+            "max_ms": samples[-1],
+            "buckets": buckets,
+        }
+
+
+class LookupStats:
+    """
+    Rolling histograms of stage durations, shared by every thread.
+
+    Recording a sample only appends to a deque under a lock, so it is cheap
+    enough for the lookup path. Callers time stages themselves:
+
+        start = time.perf_counter()
+        ...
+        LOOKUP_STATS.record(timing.SYNSET_QUERY, time.perf_counter() - start)
+    """
+
+    def __init__(self):
+        self._histograms: dict[str, RollingHistogram] = {}
+        self._lock = threading.Lock()
+        self._started = time.time()
+
+    def record(self, stage: str, seconds: float) -> None:
+        """
+        Records the duration of a stage.
+
+        Args:
+            stage: The stage name, e.g. timing.SYNSET_QUERY.
+            seconds: How long it took.
+        """
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                histogram = self._histograms[stage] = RollingHistogram()
+            histogram.add(seconds)
+            log_now = stage == LOOKUP and histogram.count % LOG_INTERVAL == 0
+
+        if log_now and utils.LOGGER.isEnabledFor(logging.INFO):
+            self.log_summary()
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """Returns the summary of every stage that has been recorded, by stage name."""
+        with self._lock:
+            return {stage: histogram.summary() for stage, histogram in sorted(self._histograms.items())}
+
+    def format_summary(self) -> str:
+        """Formats the summary as a plain text table, one stage per line."""
+        lines = [f"{'stage':<16}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}"]
+        for stage, summary in self.summary().items():
+            if "p50_ms" not in summary:
+                continue
+            lines.append(
+                f"{stage:<16}{summary['count']:>8}{summary['p50_ms']:>10.3f}{summary['p95_ms']:>10.3f}"
+                f"{summary['p99_ms']:>10.3f}{summary['max_ms']:>10.3f}"
+            )
+        return "\n".join(lines)
+
+    def log_summary(self) -> None:
+        """Logs the summary at info level, which is shown with --verbose."""
+        utils.log_info(f"Lookup timings over the last {ROLLING_WINDOW} samples per stage:\n{self.format_summary()}")
+
+    def dump(self, path: str = STATS_FILE) -> None:
+        """
+        Writes the summary to a JSON file.
+
+        The file is written next to its final location and moved into place.
+        """
+        report = {
+            "started": self._started,
+            "written": time.time(),
+            "rolling_window": ROLLING_WINDOW,
+            "stages": self.summary(),
+        }
+        temp_path = f"{path}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as stats_file:
+                json.dump(report, stats_file, indent=2)
+            os.replace(temp_path, path)
+        except OSError as e:
+            utils.log_warning(f"Could not write lookup statistics: {e}")
+
+    def clear(self) -> None:
+        """Forgets every sample."""
+        with self._lock:
+            self._histograms.clear()
+
+    def report(self) -> None:
+        """Logs the summary and writes it to STATS_FILE, if anything has been recorded."""
+        with self._lock:
+            recorded = bool(self._histograms)
+        if recorded:
+            self.log_summary()
+            self.dump()
+
+
+LOOKUP_STATS = LookupStats()
@@ -5,18 +5,22 @@
 This module provides project-wide utilities, including:
 - Global constants for important file paths (CONFIG_DIR, DATA_DIR, etc.).
 - A centralized logging setup with helper functions.
+- Small threading helpers shared by the backend modules.
 """
 
 from __future__ import annotations
 
 import logging
 import os
+import threading
 import traceback
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
 from gi.repository import GLib
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from logging import Logger
 
 RES_PATH = "/dev/mufeed/Wordbook"
@@ -77,3 +81,51 @@ def log_warning(message: str) -> None:
     trace = traceback.format_exc()
     if "NoneType: None" not in trace:
         LOGGER.warning(trace)
+
+
+class ReadWriteLock:
+    """
+    A writer-preferring reader/writer lock.
+
+    Any number of readers may hold the lock at the same time. A writer waits
+    for the active readers to finish and holds the lock exclusively; while a
+    writer is waiting, new readers queue behind it so writers cannot starve.
+    The lock is not reentrant.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer_active = False
+        self._writers_waiting = 0
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """Holds the lock in shared mode for the duration of the block."""
+        with self._condition:
+            while self._writer_active or self._writers_waiting:
+                self._condition.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """Holds the lock in exclusive mode for the duration of the block."""
+        with self._condition:
+            self._writers_waiting += 1
+            while self._writer_active or self._readers:
+                self._condition.wait()
+            self._writers_waiting -= 1
+            self._writer_active = True
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writer_active = False
+                self._condition.notify_all()
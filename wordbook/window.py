@@ -12,17 +12,48 @@ from gettext import gettext as _
 from typing import TYPE_CHECKING
 
 from gi.repository import Adw, Gdk, Gio, GLib, GObject, Gtk, Pango
-from rapidfuzz import fuzz, process
-from wn import Error
-from wn.util import ProgressHandler
 
 from wordbook import base, utils
+from wordbook.history import HISTORY_STORE
+from wordbook.index import FuzzyIndex, PrefixIndex
 from wordbook.settings import Settings
-from wordbook.settings_window import SettingsDialog
+from wordbook.timing import LOOKUP_STATS, STATS_FILE
 
 if TYPE_CHECKING:
     from typing import Any
 
+    import wn
+
+# "Did you mean" suggestions are computed in the search thread, but are still
+# bounded so that a slow lookup never holds back the failure page.
+SUGGESTION_LIMIT = 5
+SUGGESTION_TIME_BUDGET = 0.05
+
+# Until the fuzzy index is built, suggestions come from a rapidfuzz scan over
+# the wordlist and need at least this QRatio score.
+SUGGESTION_SCAN_CUTOFF = 70
+
+# Live searches wait this long (in seconds) for the next keystroke before
+# running, so that typing a word only looks up the finished word.
+LIVE_SEARCH_DEBOUNCE = 0.15
+
+# After a successful lookup, the related words on screen and this many
+# completions of the term are looked up in the background, so that following
+# one of them is served from the definition cache.
+PREFETCH_COMPLETIONS = 5
+
+# The history sidebar loads this many entries at a time, and the next page
+# whenever it is scrolled to the bottom.
+HISTORY_PAGE_SIZE = 50
+
+# Relations shown under a definition, as (label, result key) pairs.
+RELATION_TYPES = [
+    ("Synonyms", "syn"),
+    ("Antonyms", "ant"),
+    ("Similar to", "sim"),
+    ("Also see", "also_sees"),
+]
+
 
 class SearchStatus(Enum):
     NONE = auto()
@@ -50,9 +81,152 @@ class HistoryObject(GObject.Object):
         self.is_favorite = is_favorite
 
 
-class ProgressUpdater(ProgressHandler):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+class DefinitionItem(GObject.Object):
+    """One definition (synset) of the current result, shown as a row of the definitions view."""
+
+    synset: dict[str, Any] = {}
+    number = 1
+    pos_header: str | None = None
+    synset_header: str | None = None
+    group_start = False
+    group_end = False
+
+    def __init__(self, synset, number, pos_header=None, synset_header=None, group_start=False, group_end=False):
+        super().__init__()
+        self.synset = synset
+        self.number = number
+        self.pos_header = pos_header
+        self.synset_header = synset_header
+        self.group_start = group_start
+        self.group_end = group_end
+
+
+class DefinitionRow(Gtk.Box):
+    """
+    A recyclable row widget for the definitions view.
+
+    The widgets are created once when the list item is set up and only relabelled,
+    shown or hidden when the row is bound to another DefinitionItem, so scrolling
+    through a long result never builds widgets for rows that are off screen.
+    """
+
+    def __init__(self, window: WordbookWindow):
+        super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=12, css_classes=["definition-row"])
+        self._window = window
+
+        self.pos_header = Gtk.Label(xalign=0.0, use_markup=True, css_classes=["pos-header"])
+        self.append(self.pos_header)
+
+        self.synset_header = Gtk.Label(xalign=0.0, use_markup=True, margin_top=8, css_classes=["synset-header"])
+        self.append(self.synset_header)
+
+        def_main_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
+        self.number_label = Gtk.Label(
+            use_markup=True,
+            valign=Gtk.Align.START,
+            margin_top=2,
+            css_classes=[
+                "definition-number",
+            ],
+        )
+        self.number_label.set_size_request(20, -1)
+        def_main_box.append(self.number_label)
+
+        self.content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6, hexpand=True)
+        self.definition_label = self._create_text_label("definition")
+        self.content_box.append(self.definition_label)
+        self.example_labels: list[Gtk.Label] = []
+
+        # One wrap box per relation type; the examples are inserted before them.
+        self.relation_boxes: dict[str, tuple[Adw.WrapBox, list[Gtk.Button]]] = {}
+        for relation_type, relation_key in RELATION_TYPES:
+            wrap_box = Adw.WrapBox(valign=Gtk.Align.START, line_spacing=4, child_spacing=6)
+            type_label = Gtk.Label(
+                label=f"{relation_type}:",
+                xalign=0.0,
+                valign=Gtk.Align.CENTER,
+                css_classes=[
+                    "relation-type",
+                ],
+            )
+            wrap_box.append(type_label)
+            self.content_box.append(wrap_box)
+            self.relation_boxes[relation_key] = (wrap_box, [])
+
+        def_main_box.append(self.content_box)
+        self.append(def_main_box)
+
+    def _create_text_label(self, css_class: str) -> Gtk.Label:
+        """Creates a selectable label that supports double-click search."""
+        label = Gtk.Label(
+            wrap=True,
+            xalign=0.0,
+            selectable=True,
+            extra_menu=self._window._def_extra_menu_model,
+            css_classes=[
+                css_class,
+            ],
+        )
+
+        click = Gtk.GestureClick.new()
+        click.connect("pressed", self._window._on_def_press_event)
+        click.connect("stopped", self._window._on_def_stop_event)
+        label.add_controller(click)
+        return label
+
+    def bind(self, item: DefinitionItem) -> None:
+        """Shows the given definition in this row, reusing the existing widgets."""
+        synset = item.synset
+
+        self.pos_header.set_visible(item.pos_header is not None)
+        self.pos_header.set_label(item.pos_header or "")
+        self.synset_header.set_visible(item.synset_header is not None)
+        self.synset_header.set_label(item.synset_header or "")
+        self.number_label.set_label(str(item.number))
+        self.definition_label.set_label(synset["definition"])
+
+        examples = synset.get("examples", [])
+        while len(self.example_labels) < len(examples):
+            example_label = self._create_text_label("example-text")
+            previous = self.example_labels[-1] if self.example_labels else self.definition_label
+            self.content_box.insert_child_after(example_label, previous)
+            self.example_labels.append(example_label)
+        for index, example_label in enumerate(self.example_labels):
+            example_label.set_visible(index < len(examples))
+            if index < len(examples):
+                example_label.set_label(examples[index])
+
+        for relation_key, (wrap_box, buttons) in self.relation_boxes.items():
+            words = synset.get(relation_key, [])
+            wrap_box.set_visible(bool(words))
+            while len(buttons) < len(words):
+                button = Gtk.Button(css_classes=["lemma-button"])
+                button.connect("clicked", self._window._on_word_button_clicked)
+                wrap_box.append(button)
+                buttons.append(button)
+            for index, button in enumerate(buttons):
+                button.set_visible(index < len(words))
+                if index < len(words):
+                    button.set_label(words[index])
+
+        for css_class, enabled in (("group-start", item.group_start), ("group-end", item.group_end)):
+            if enabled:
+                self.add_css_class(css_class)
+            else:
+                self.remove_css_class(css_class)
+
+
+class ProgressUpdater:
+    """
+    Shows WordNet download progress on the download page.
+
+    This implements the interface of wn.util.ProgressHandler rather than
+    subclassing it, so that wn does not need to be imported to show the window.
+    """
+
+    def __init__(self, **kwargs):
+        self.kwargs = {"count": 0, "total": 0, "refresh_interval": 0, "message": "", "unit": "", "status": ""}
+        self.kwargs.update(kwargs)
         self._last_update_time = 0
         self._update_interval = 0.1  # 100ms
 
@@ -73,6 +247,14 @@ class ProgressUpdater(ProgressHandler):
                 progress_fraction,
             )
 
+    def set(self, **kwargs):
+        """Update the progress parameters and refresh the progress bar."""
+        self.kwargs.update(kwargs)
+        self.update(0, force=True)
+
+    def close(self):
+        """Called by wn once the process is complete."""
+
     @staticmethod
     def flash(message):
         """Update the progress label on the download page."""
@@ -105,10 +287,11 @@ class WordbookWindow(Adw.ApplicationWindow):
     _main_split_view: Adw.OverlaySplitView = Gtk.Template.Child("main_split_view")  # type: ignore
     _history_stack: Gtk.ListBox = Gtk.Template.Child("history_stack")  # type: ignore
     _history_listbox: Gtk.ListBox = Gtk.Template.Child("history_listbox")  # type: ignore
+    _history_scroll: Gtk.ScrolledWindow = Gtk.Template.Child("history_scroll")  # type: ignore
     _main_stack: Adw.ViewStack = Gtk.Template.Child("main_stack")  # type: ignore
     _toast_overlay: Adw.ToastOverlay = Gtk.Template.Child("toast_overlay")  # type: ignore
     _main_scroll: Gtk.ScrolledWindow = Gtk.Template.Child("main_scroll")  # type: ignore
-    _definitions_listbox: Gtk.ListBox = Gtk.Template.Child("definitions_listbox")  # type: ignore
+    _definitions_view: Gtk.ListView = Gtk.Template.Child("definitions_view")  # type: ignore
     _pronunciation_view: Gtk.Label = Gtk.Template.Child("pronunciation_view")  # type: ignore
     _term_view: Gtk.Label = Gtk.Template.Child("term_view")  # type: ignore
     _network_fail_status_page: Adw.StatusPage = Gtk.Template.Child("network_fail_status_page")  # type: ignore
@@ -122,15 +305,19 @@ class WordbookWindow(Adw.ApplicationWindow):
     _style_manager: Adw.StyleManager | None = None
 
     _wn_downloader: base.WordnetDownloader = base.WordnetDownloader()
-    _wn_instance: base.wn.Wordnet | None = None
+    _wn_instance: wn.Wordnet | None = None
     _wn_wordlist: list[str] = []
+    _completion_index: PrefixIndex | None = None
+    _suggestion_index: FuzzyIndex | None = None
 
     _doubled: bool = False
     _completion_request_count: int = 0
     _searched_term: str | None = None
     _search_history: Gio.ListStore | None = None
-    _active_thread: threading.Thread | None = None
-    _search_cancellation_event: threading.Event | None = None
+    _definitions: Gio.ListStore | None = None
+    _search_scheduler: base.SearchScheduler | None = None
+    _prefetcher: base.Prefetcher | None = None
+    _scheduled_text: str | None = None
     _primary_clipboard_text: str | None = None
     _show_favorites_only: bool = False
 
@@ -150,6 +337,8 @@ class WordbookWindow(Adw.ApplicationWindow):
 
         self.lookup_term = term
         self.auto_paste_requested = auto_paste_requested
+        self._search_scheduler = base.SearchScheduler(self._run_search, self._on_search_result)
+        self._prefetcher = base.Prefetcher()
 
         app = self.get_application()
         if app.development_mode:
@@ -165,6 +354,7 @@ class WordbookWindow(Adw.ApplicationWindow):
         self._history_listbox.bind_model(self._search_history, self._create_history_label)
         self._history_listbox.connect("row-activated", self._on_history_item_activated)
         self._search_history.connect("items-changed", self._on_history_items_changed)
+        self._history_scroll.connect("edge-reached", self._on_history_edge_reached)
 
         self.connect("notify::is-active", self._on_is_active_changed)
         self.connect("unrealize", self._on_destroy)
@@ -178,6 +368,13 @@ class WordbookWindow(Adw.ApplicationWindow):
         self._exit_button.connect("clicked", self._on_exit_clicked)
         self._clear_history_button.connect("clicked", self._on_clear_history)
 
+        self._definitions = Gio.ListStore.new(DefinitionItem)
+        definitions_factory = Gtk.SignalListItemFactory()
+        definitions_factory.connect("setup", self._on_definition_setup)
+        definitions_factory.connect("bind", self._on_definition_bind)
+        self._definitions_view.set_model(Gtk.NoSelection.new(self._definitions))
+        self._definitions_view.set_factory(definitions_factory)
+
         self._main_split_view.bind_property(
             "show-sidebar",
             self._split_view_toggle_button,
@@ -197,10 +394,9 @@ class WordbookWindow(Adw.ApplicationWindow):
         self.completer.set_popup_set_width(True)
         self._search_entry.set_completion(self.completer)
 
-        history_items = [HistoryObject(term, Settings.get().is_favorite(term)) for term in Settings.get().history]
-        self._search_history.splice(0, 0, history_items)
-
-        self._update_clear_button_sensitivity()
+        if HISTORY_STORE.import_legacy(*Settings.get().legacy_history):
+            Settings.get().clear_legacy_history()
+        self._load_history()
 
         self.search_button.set_visible(not Settings.get().live_search)
         if not Settings.get().live_search:
@@ -244,6 +440,11 @@ class WordbookWindow(Adw.ApplicationWindow):
         toggle_favorites_action.connect("activate", self.on_toggle_favorites)
         self.add_action(toggle_favorites_action)
 
+        # Debugging aid: shows the per-stage lookup timings.
+        lookup_stats_action = Gio.SimpleAction.new("lookup-stats", None)
+        lookup_stats_action.connect("activate", self.on_lookup_stats)
+        self.add_action(lookup_stats_action)
+
         quit_action = Gio.SimpleAction.new("quit", None)
         quit_action.connect("activate", lambda action, param: self.close())
         self.add_action(quit_action)
@@ -271,6 +472,29 @@ class WordbookWindow(Adw.ApplicationWindow):
         cancellable = Gio.Cancellable()
         clipboard.read_text_async(cancellable, on_selection)
 
+    def on_lookup_stats(self, _action, _param):
+        """Callback for the 'lookup-stats' action. Shows how long each stage of recent lookups took."""
+        cache = base.DEFINITION_CACHE.stats()
+        body = (
+            f"{LOOKUP_STATS.format_summary()}\n\n"
+            f"definition cache: {cache['hits']} hits, {cache['misses']} misses, "
+            f"{cache['size']}/{cache['maxsize']} entries"
+        )
+
+        dialog = Adw.AlertDialog.new(_("Lookup Statistics"), None)
+        dialog.set_extra_child(Gtk.Label(label=body, selectable=True, xalign=0.0, css_classes=["monospace"]))
+        dialog.add_response("save", _("Save as JSON"))
+        dialog.add_response("dismiss", _("Dismiss"))
+        dialog.set_default_response("dismiss")
+        dialog.connect("response", self._on_lookup_stats_response)
+        dialog.present(self)
+
+    def _on_lookup_stats_response(self, _dialog, response):
+        """Writes the lookup statistics to disk if asked to."""
+        if response == "save":
+            LOOKUP_STATS.dump()
+            self._toast_overlay.add_toast(Adw.Toast.new(_("Saved to {path}").format(path=STATS_FILE)))
+
     def on_paste_search(self, _action=None, _param=None):
         """Callback for the 'paste-search' action. Pastes and searches clipboard content."""
         clipboard = Gdk.Display.get_default().get_clipboard()
@@ -290,6 +514,8 @@ class WordbookWindow(Adw.ApplicationWindow):
 
     def on_preferences(self, _action, _param):
         """Callback for the 'preferences' action. Shows the settings window."""
+        from wordbook.settings_window import SettingsDialog
+
         window = SettingsDialog(self)
         window.present(self)
 
@@ -312,50 +538,51 @@ class WordbookWindow(Adw.ApplicationWindow):
         """Callback for the 'toggle-favorites' action. Toggles the history filter."""
         self._toggle_favorites_filter()
 
-    def on_search_clicked(self, _button=None, pass_check=False, text=None):
-        """Initiates a search, cancelling any previous search."""
-        self._clear_definitions()
-
+    def on_search_clicked(self, _button=None, pass_check=False, text=None, live=False):
+        """Initiates a search, superseding any previous search."""
         if text is None:
             text = self._search_entry.get_text().strip()
 
+        if live and text == self._scheduled_text:
+            return  # Already searched for or about to be.
+
+        # Interactive searches always go first.
+        self._prefetcher.cancel()
+        self._clear_definitions()
+        self._scheduled_text = text
+
         if not text:
+            self._search_scheduler.cancel()
             self._page_switch(Page.WELCOME)
             return
 
-        if self._active_thread and self._active_thread.is_alive():
-            if self._search_cancellation_event:
-                self._search_cancellation_event.set()
-
         self._page_switch(Page.SPINNER)
+        self._search_scheduler.submit(text, debounce=LIVE_SEARCH_DEBOUNCE if live else 0.0)
 
-        self._search_cancellation_event = threading.Event()
-        self._active_thread = threading.Thread(
-            target=self.threaded_search,
-            args=[text, pass_check, self._search_cancellation_event],
-            daemon=True,
-        )
-        self._active_thread.start()
-
-    def threaded_search(self, text, pass_check, cancellation_event):
+    def _run_search(self, generation, text):
         """
-        Performs the search in a background thread.
-        This prevents the UI from freezing during network or intensive search operations.
+        Performs the search on the search scheduler's worker thread.
+        This prevents the UI from freezing during intensive search operations.
         """
-        if cancellation_event.is_set():
-            return
-
         self._searched_term = text
 
-        out = self._search(text)
+        out = self._search(generation, text)
 
-        if cancellation_event.is_set():
-            return
+        # Suggestions are only worth computing if no newer search is waiting.
+        if out and not out.get("result") and "suggestions" not in out and not self._search_scheduler.has_pending():
+            out["suggestions"] = self._get_suggestions(text)
+
+        return out
 
-        GLib.idle_add(self._on_search_finished, out)
+    def _on_search_result(self, generation, out):
+        """Passes a finished search to the main thread. Called on the worker thread."""
+        GLib.idle_add(self._on_search_finished, out, generation)
 
-    def _on_search_finished(self, result):
+    def _on_search_finished(self, result, generation=None):
         """Handles the result of a search on the main thread."""
+        if generation is not None and not self._search_scheduler.is_current(generation):
+            return  # A newer search was started while this one was queued.
+
         if not result:
             self._page_switch(Page.WELCOME)
             return
@@ -363,31 +590,20 @@ class WordbookWindow(Adw.ApplicationWindow):
         status = result.get("status", SearchStatus.SUCCESS if result.get("result") else SearchStatus.FAILURE)
 
         if status == SearchStatus.SUCCESS:
-            self._populate_definitions(result["result"])
-            self._term_view.set_text(result["term"].strip())
-            self._term_view.set_tooltip_text(result["term"].strip())
+            # The definitions themselves were shown by _on_definition_chunk as they were read.
             self._pronunciation_view.set_text(result["pronunciation"].strip().replace("\n", ""))
             self._pronunciation_view.set_tooltip_text(result["pronunciation"].strip().replace("\n", ""))
-            self._speak_button.set_visible(True)
-            self._page_switch(Page.CONTENT)
 
             if Settings.get().live_search:
                 self._add_to_history_delayed(result["term"])
             else:
                 self._add_to_history(result["term"])
 
-        elif status == SearchStatus.FAILURE:
-            suggestions = process.extract(
-                self._searched_term,
-                self._wn_wordlist if self._wn_wordlist else [],
-                limit=5,
-                scorer=fuzz.QRatio,
-            )
+            self._prefetch_related(result)
 
+        elif status == SearchStatus.FAILURE:
             suggestion_links = [
-                f'<a href="search;{suggestion.replace("_", " ")}">{suggestion.replace("_", " ")}</a>'
-                for suggestion, score, _ in suggestions
-                if score > 70
+                f'<a href="search;{suggestion}">{suggestion}</a>' for suggestion in result.get("suggestions", [])
             ]
 
             if suggestion_links:
@@ -402,7 +618,34 @@ class WordbookWindow(Adw.ApplicationWindow):
         else:  # RESET or other cases
             self._page_switch(Page.WELCOME)
 
-        self._active_thread = None
+    def _prefetch_related(self, result: dict[str, Any]) -> None:
+        """Looks up the related words shown for a result and the top completions of its term in the background."""
+        terms = [
+            word
+            for synsets in result["result"].values()
+            for synset in synsets
+            for _relation_type, relation_key in RELATION_TYPES
+            for word in synset.get(relation_key, [])
+        ]
+        if self._completion_index:
+            terms.extend(self._completion_index.complete(result["term"], PREFETCH_COMPLETIONS))
+        self._prefetcher.prefetch(terms, self._wn_instance)
+
+    def _on_definition_chunk(self, chunk, generation, first):
+        """Shows the definitions of one part of speech on the main thread, as soon as they are read."""
+        if not self._search_scheduler.is_current(generation):
+            return  # A newer search was started while this one was running.
+
+        if first:
+            self._clear_definitions()
+            self._term_view.set_text(chunk["term"].strip())
+            self._term_view.set_tooltip_text(chunk["term"].strip())
+            self._pronunciation_view.set_text("")
+            self._pronunciation_view.set_tooltip_text("")
+            self._speak_button.set_visible(True)
+            self._page_switch(Page.CONTENT)
+
+        self._append_definitions(chunk["result"])
 
     def trigger_search(self, text):
         """A convenience method to trigger a search from other parts of the app."""
@@ -444,21 +687,16 @@ class WordbookWindow(Adw.ApplicationWindow):
             GLib.idle_add(self.on_paste_search)
 
     def _on_destroy(self, _window: Gtk.Window):
-        """Saves window state and history upon closing the window."""
+        """Saves window state upon closing the window."""
+        self._search_scheduler.shutdown()
+        self._prefetcher.shutdown()
+
         if self._history_delay_timer is not None:
             GLib.source_remove(self._history_delay_timer)
             self._history_delay_timer = None
 
-        history_list = []
-        if self._search_history:
-            for i in range(self._search_history.get_n_items()):
-                item = self._search_history.get_item(i)
-                if item:
-                    history_list.append(item.term)
-
         width, height = self.get_default_size()
         settings_to_update = {
-            "history": history_list[-20:],
             "window_width": width,
             "window_height": height,
         }
@@ -475,45 +713,57 @@ class WordbookWindow(Adw.ApplicationWindow):
             ).start()
 
         if Settings.get().live_search:
-            GLib.idle_add(self.on_search_clicked)
+            self.on_search_clicked(live=True)
 
     def _on_clear_history(self, _widget):
         """Clears non-favorited items from the search history."""
-        items_to_remove = []
-        for i in range(self._search_history.get_n_items()):
-            item = self._search_history.get_item(i)
-            if not item.is_favorite:
-                items_to_remove.append((i, item))
-
-        if not items_to_remove:
+        removed_entries = HISTORY_STORE.clear()
+        if not removed_entries:
             return
 
-        # Remove items from the history, iterating backwards through the indices
-        # to ensure that the indices of items yet to be removed are not affected.
-        for i, _item in reversed(items_to_remove):
-            self._search_history.remove(i)
-
-        self._update_clear_button_sensitivity()
+        self._load_history()
 
         toast = Adw.Toast.new(_("History cleared"))
         toast.set_button_label(_("Undo"))
-        toast.connect("button-clicked", self._on_undo_clear_history, items_to_remove)
+        toast.connect("button-clicked", self._on_undo_clear_history, removed_entries)
         self._toast_overlay.add_toast(toast)
 
-    def _on_undo_clear_history(self, _toast, items_to_restore):
+    def _on_undo_clear_history(self, _toast, entries_to_restore):
         """Restores the history that was just cleared."""
-        for i, item in items_to_restore:
-            self._search_history.insert(i, item)
-
+        HISTORY_STORE.restore(entries_to_restore)
+        self._load_history()
+
+    def _load_history(self):
+        """Replaces the history sidebar contents with the first page of the history store."""
+        entries = HISTORY_STORE.page(0, HISTORY_PAGE_SIZE, favorites_only=self._show_favorites_only)
+        self._search_history.splice(
+            0,
+            self._search_history.get_n_items(),
+            [HistoryObject(term, is_favorite) for term, is_favorite in entries],
+        )
         self._update_clear_button_sensitivity()
 
+    def _on_history_edge_reached(self, _scroll, position: Gtk.PositionType):
+        """Loads the next page of history when the sidebar is scrolled to the bottom."""
+        if position != Gtk.PositionType.BOTTOM:
+            return
+
+        loaded = self._search_history.get_n_items()
+        offset = loaded
+        if self._show_favorites_only:
+            # Rows unstarred since the page was loaded are hidden, but no longer count as favorites.
+            offset = sum(item.is_favorite for item in self._search_history)
+        entries = HISTORY_STORE.page(offset, HISTORY_PAGE_SIZE, favorites_only=self._show_favorites_only)
+        if entries:
+            self._search_history.splice(loaded, 0, [HistoryObject(term, is_favorite) for term, is_favorite in entries])
+
     def _update_clear_button_sensitivity(self):
         """
         Updates the sensitivity of the clear history button based on whether
         there is history, and switches the history stack page if needed.
         """
         has_history = self._search_history.get_n_items() > 0 if self._search_history else False
-        self._clear_history_button.set_sensitive(has_history)
+        self._clear_history_button.set_sensitive(len(HISTORY_STORE) > HISTORY_STORE.count(favorites_only=True))
 
         # Switch the stack page to 'empty' if no history
         self._history_stack.set_visible_child_name("list" if has_history else "empty")
@@ -584,18 +834,27 @@ class WordbookWindow(Adw.ApplicationWindow):
 
     def _add_to_history(self, text):
         """Adds a term to the history, moving it to the top if it already exists."""
-        for i in range(self._search_history.get_n_items()):
-            item = self._search_history.get_item(i)
-            if item.term == text:
-                self._search_history.remove(i)
-                break
+        HISTORY_STORE.add(text)
 
-        is_favorite = Settings.get().is_favorite(text)
-        history_object = HistoryObject(text, is_favorite)
-        self._search_history.insert(0, history_object)
+        position = self._find_history_item(text)
+        if position is not None:
+            self._search_history.remove(position)
+
+        is_favorite = HISTORY_STORE.is_favorite(text)
+        if is_favorite or not self._show_favorites_only:
+            self._search_history.insert(0, HistoryObject(text, is_favorite))
 
         self._update_clear_button_sensitivity()
 
+    def _find_history_item(self, term: str) -> int | None:
+        """Returns the position of a term in the loaded history, if it has been loaded."""
+        if term not in HISTORY_STORE:
+            return None
+        for i, item in enumerate(self._search_history):
+            if item.term == term:
+                return i
+        return None
+
     def _add_to_history_delayed(self, text):
         """Adds a term to history after a delay, cancelling any previously pending additions."""
         if self._history_delay_timer is not None:
@@ -666,18 +925,13 @@ class WordbookWindow(Adw.ApplicationWindow):
 
     def _on_favorite_toggled(self, button: Gtk.Button, item: HistoryObject):
         """Toggles the favorite status of a history item and updates the UI."""
-        settings = Settings.get()
-        is_now_favorite = not item.is_favorite
-        item.is_favorite = is_now_favorite
-
-        if is_now_favorite:
-            settings.add_favorite(item.term)
-        else:
-            settings.remove_favorite(item.term)
+        item.is_favorite = not item.is_favorite
+        HISTORY_STORE.set_favorite(item.term, item.is_favorite)
 
         row = button.get_ancestor(Gtk.ListBoxRow)
         if row:
             self._update_row_visuals(row, item)
+        self._update_clear_button_sensitivity()
 
     def _update_row_visuals(self, row: Gtk.ListBoxRow, item: HistoryObject):
         """Updates the icon, CSS class, and visibility of a history row."""
@@ -694,18 +948,14 @@ class WordbookWindow(Adw.ApplicationWindow):
         row.set_visible(not self._show_favorites_only or item.is_favorite)
 
     def _toggle_favorites_filter(self):
-        """Toggles the visibility of history items based on their favorite status."""
+        """Toggles between showing the whole history and only favorites."""
         self._show_favorites_only = not self._show_favorites_only
         self._favorites_filter_button.set_active(self._show_favorites_only)
         self._favorites_filter_button.set_icon_name(
             "starred-symbolic" if self._show_favorites_only else "non-starred-symbolic"
         )
 
-        for i in range(self._search_history.get_n_items()):
-            item = self._search_history.get_item(i)
-            row = self._history_listbox.get_row_at_index(i)
-            if row:
-                row.set_visible(not self._show_favorites_only or item.is_favorite)
+        self._load_history()
 
     def _new_error(self, primary_text, secondary_text) -> None:
         """Shows an error dialog."""
@@ -721,16 +971,15 @@ class WordbookWindow(Adw.ApplicationWindow):
         GLib.idle_add(self._main_stack.set_visible_child_name, page)
         return False
 
-    def _search(self, search_text: str) -> dict[str, Any] | None:
+    def _search(self, generation: int, search_text: str) -> dict[str, Any] | None:
         """Cleans input text, passes it to the backend for definition, and handles errors."""
+        if search_text.startswith(base.REVERSE_SEARCH_PREFIX):
+            return self._reverse_search(generation, search_text)
+
         text = base.clean_search_terms(search_text)
         if text and text.strip():
             if self._wn_instance:
-                return base.format_output(
-                    text,
-                    self._wn_instance,
-                    accent=Settings.get().pronunciations_accent.code,
-                )
+                return self._stream_definition(generation, text)
             else:
                 return None  # WordNet instance not ready yet
         if not Settings.get().live_search:
@@ -742,23 +991,82 @@ class WordbookWindow(Adw.ApplicationWindow):
         self._searched_term = None
         return None
 
+    def _stream_definition(self, generation: int, text: str) -> dict[str, Any] | None:
+        """
+        Looks up a term, passing each part of speech to the main thread as soon as it is read.
+
+        Returns:
+            The complete definition data with its pronunciation, or None if a newer search
+            was started while this one was running.
+        """
+        term = text
+        result: dict[str, Any] = {}
+        with base.wn_database_read():
+            for chunk in base.iter_definition(text, self._wn_instance):
+                if not self._search_scheduler.is_current(generation):
+                    return None  # Stop reading relations nobody will see.
+                term = chunk["term"]
+                GLib.idle_add(self._on_definition_chunk, chunk, generation, not result)
+                result.update(chunk["result"])
+
+        if not result:
+            return {"term": text, "pronunciation": "", "result": None}
+        return {
+            "term": term,
+            "pronunciation": base.fetch_pronunciation(term, Settings.get().pronunciations_accent.code),
+            "result": result,
+        }
+
+    def _reverse_search(self, generation: int, search_text: str) -> dict[str, Any] | None:
+        """
+        Looks for words by their definition, showing the matches as a single group.
+
+        Returns:
+            The matches, under the search text so that the search can be repeated from the history.
+        """
+        query = search_text.removeprefix(base.REVERSE_SEARCH_PREFIX).strip()
+        if not query:
+            return None
+
+        self._searched_term = query
+        definition = base.reverse_lookup(query)
+        if not definition["result"]:
+            return {"term": search_text, "pronunciation": "", "result": None, "suggestions": []}
+
+        GLib.idle_add(self._on_definition_chunk, definition, generation, True)
+        return {"term": search_text, "pronunciation": "", "result": definition["result"]}
+
+    def _get_suggestions(self, text: str) -> list[str]:
+        """Finds words close to a failed search term. Runs in the search thread."""
+        if self._suggestion_index:
+            return self._suggestion_index.search(
+                base.clean_search_terms(text),
+                limit=SUGGESTION_LIMIT,
+                deadline=time.monotonic() + SUGGESTION_TIME_BUDGET,
+            )
+        if not self._completion_index:
+            return []
+
+        # The fuzzy index is still being built, so scan the whole wordlist instead.
+        from rapidfuzz import fuzz, process
+
+        matches = process.extract(
+            base.clean_search_terms(text),
+            self._completion_index.words,
+            limit=SUGGESTION_LIMIT,
+            scorer=fuzz.QRatio,
+            score_cutoff=SUGGESTION_SCAN_CUTOFF,
+        )
+        return [word for word, _score, _index in matches]
+
     def _update_completions(self, text):
         """Updates the search entry's completion model based on the current text."""
         while self._completion_request_count > 0:
             completer_liststore = Gtk.ListStore(str)
-            _complete_list = []
-
-            if self._wn_wordlist:
-                for item in self._wn_wordlist:
-                    if len(_complete_list) >= 10:
-                        break
-                    item = item.replace("_", " ")
-                    if item.lower().startswith(text.lower()) and item not in _complete_list:
-                        _complete_list.append(item)
 
-            _complete_list = sorted(_complete_list, key=str.casefold)
-            for item in _complete_list:
-                completer_liststore.append((item,))
+            if self._completion_index:
+                for item in self._completion_index.complete(text):
+                    completer_liststore.append((item,))
 
             self._completion_request_count -= 1
             GLib.idle_add(self.completer.set_model, completer_liststore)
@@ -832,19 +1140,38 @@ class WordbookWindow(Adw.ApplicationWindow):
 
         try:
             wordlist = future.result()
-            GLib.idle_add(self._on_wordlist_loaded_success, wordlist)
+            # Build the indexes here, on the worker thread, so the main thread
+            # only has to swap them in. Completions are published first, as the
+            # suggestion index takes much longer to build.
+            completion_index = PrefixIndex(wordlist)
+            GLib.idle_add(self._on_wordlist_loaded_success, wordlist, completion_index)
+            suggestion_index = FuzzyIndex(completion_index.words)
+            GLib.idle_add(self._on_suggestion_index_built, suggestion_index)
         except Exception as e:
             utils.log_error(f"Error getting wordlist result: {e}")
 
-    def _on_wordlist_loaded_success(self, wordlist):
+    def _on_suggestion_index_built(self, suggestion_index):
+        """Switches "did you mean" suggestions over to the fuzzy index."""
+        self._suggestion_index = suggestion_index
+        utils.log_info("Suggestion index built.")
+
+    def _on_wordlist_loaded_success(self, wordlist, completion_index):
         """Handles successful wordlist loading."""
         self._wn_wordlist = wordlist
+        self._completion_index = completion_index
         utils.log_info(f"Wordlist loaded with {len(self._wn_wordlist)} words. Completions now available.")
+        self.get_application().report_startup_time("completions ready")
+        # Build the lexicon snapshot and the reverse index in the background.
+        # Lookups switch over to them as soon as they are ready, and this is a
+        # no-op when they are up to date.
+        base.update_snapshot()
+        base.update_reverse_index()
 
     def _complete_initialization(self):
         """Finalizes the initialization process and shows the main welcome screen."""
         self._set_header_sensitive(True)
         self._page_switch(Page.WELCOME)
+        self.get_application().report_startup_time("first search ready")
 
         if self.lookup_term:
             self.trigger_search(self.lookup_term)
@@ -854,10 +1181,11 @@ class WordbookWindow(Adw.ApplicationWindow):
 
     def _download_wordnet_thread(self):
         """Downloads WordNet data in a background thread."""
+        wn = base.import_wn()
         try:
             self._wn_downloader.download(ProgressUpdater)
             GLib.idle_add(self._on_download_complete)
-        except Error as err:
+        except wn.Error as err:
             GLib.idle_add(self._on_download_failed, err)
 
     def _on_download_complete(self):
@@ -872,188 +1200,58 @@ class WordbookWindow(Adw.ApplicationWindow):
         self._page_switch(Page.NETWORK_FAIL)
 
     def _clear_definitions(self) -> None:
-        """Clears all definitions from the listbox."""
-        while (child := self._definitions_listbox.get_first_child()) is not None:
-            self._definitions_listbox.remove(child)
-
-    def _create_definition_widget(self, pos: str, synsets: list[dict[str, Any]]) -> Gtk.Widget:
-        """Creates a widget to display definitions for a specific part of speech."""
-        pos_box = Gtk.Box(
-            orientation=Gtk.Orientation.VERTICAL,
-            spacing=12,
-            margin_top=12,
-            margin_bottom=12,
-            margin_start=12,
-            margin_end=12,
-        )
+        """Clears all definitions from the definitions view."""
+        self._definitions.remove_all()
 
-        pos_header = Gtk.Label(
-            label=pos,
-            xalign=0.0,
-            use_markup=True,
-            css_classes=[
-                "pos-header",
-            ],
-        )
-        pos_box.append(pos_header)
+    def _on_definition_setup(self, _factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem) -> None:
+        """Creates the row widget for a list item; it is reused for every definition the item shows."""
+        list_item.set_activatable(False)
+        list_item.set_child(DefinitionRow(self))
+
+    def _on_definition_bind(self, _factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem) -> None:
+        """Shows a definition in a (possibly recycled) row widget."""
+        list_item.get_child().bind(list_item.get_item())
+
+    def _on_word_button_clicked(self, button: Gtk.Button) -> None:
+        """Handles clicks on related word buttons, triggering a new search."""
+        self._search_entry.set_text(button.get_label())
+        self._search_entry.emit("activate")
+
+    @staticmethod
+    def _create_definition_items(pos: str, synsets: list[dict[str, Any]]) -> list[DefinitionItem]:
+        """Creates one item per definition for a specific part of speech."""
+        if pos != base.REVERSE_SEARCH_GROUP:
+            # Reverse search results keep their ranking.
+            synsets = sorted(synsets, key=lambda k: k["name"])
 
         synset_groups: dict[str, list[dict[str, Any]]] = {}
-        for synset in sorted(synsets, key=lambda k: k["name"]):
+        for synset in synsets:
             name = synset["name"]
             if name not in synset_groups:
                 synset_groups[name] = []
             synset_groups[name].append(synset)
 
-        overall_definition_number = 1
-        total_synsets = len([s for group in synset_groups.values() for s in group])
-
+        items = []
         for synset_name, group_synsets in synset_groups.items():
-            definition_number = 1
-
-            if len(synset_groups) > 1:
-                synset_header = Gtk.Label(
-                    label=synset_name,
-                    use_markup=True,
-                    xalign=0.0,
-                    margin_top=8,
-                    css_classes=[
-                        "synset-header",
-                    ],
-                )
-                pos_box.append(synset_header)
-
-            for synset in group_synsets:
-                def_main_box = Gtk.Box(
-                    orientation=Gtk.Orientation.HORIZONTAL,
-                    spacing=12,
-                )
-
-                number_label = Gtk.Label(
-                    label=str(definition_number),
-                    use_markup=True,
-                    valign=Gtk.Align.START,
-                    margin_top=2,
-                    css_classes=[
-                        "definition-number",
-                    ],
-                )
-                number_label.set_size_request(20, -1)
-                def_main_box.append(number_label)
-
-                content_box = Gtk.Box(
-                    orientation=Gtk.Orientation.VERTICAL,
-                    spacing=6,
-                    hexpand=True,
-                )
-
-                def_label = Gtk.Label(
-                    label=synset["definition"],
-                    wrap=True,
-                    xalign=0.0,
-                    selectable=True,
-                    extra_menu=self._def_extra_menu_model,
-                    css_classes=[
-                        "definition",
-                    ],
-                )
-
-                click = Gtk.GestureClick.new()
-                click.connect("pressed", self._on_def_press_event)
-                click.connect("stopped", self._on_def_stop_event)
-                def_label.add_controller(click)
-
-                content_box.append(def_label)
-
-                for example in synset.get("examples", []):
-                    example_label = Gtk.Label(
-                        label=example,
-                        wrap=True,
-                        xalign=0.0,
-                        selectable=True,
-                        extra_menu=self._def_extra_menu_model,
+            for definition_number, synset in enumerate(group_synsets, start=1):
+                items.append(
+                    DefinitionItem(
+                        synset,
+                        definition_number,
+                        pos_header=None if items else pos,
+                        synset_header=synset_name if len(synset_groups) > 1 and definition_number == 1 else None,
+                        group_start=not items,
                     )
-                    example_label.add_css_class("example-text")
-
-                    click = Gtk.GestureClick.new()
-                    click.connect("pressed", self._on_def_press_event)
-                    click.connect("stopped", self._on_def_stop_event)
-                    example_label.add_controller(click)
-
-                    content_box.append(example_label)
-
-                for relation_type, relation_key in [
-                    ("Synonyms", "syn"),
-                    ("Antonyms", "ant"),
-                    ("Similar to", "sim"),
-                    ("Also see", "also_sees"),
-                ]:
-                    words = synset.get(relation_key, [])
-                    if words:
-                        relation_box = self._create_relation_widget(relation_type, words)
-                        if relation_box:
-                            content_box.append(relation_box)
-
-                def_main_box.append(content_box)
-                pos_box.append(def_main_box)
-
-                if overall_definition_number < total_synsets:
-                    spacer = Gtk.Separator(margin_top=4, margin_bottom=4)
-                    pos_box.append(spacer)
-
-                definition_number += 1
-                overall_definition_number += 1
-
-        return pos_box
-
-    def _create_relation_widget(self, relation_type: str, words: list[str]) -> Gtk.Widget | None:
-        """Creates a widget to display related words (e.g., synonyms) as clickable buttons."""
-        if not words:
-            return None
-
-        wrap_box = Adw.WrapBox(
-            valign=Gtk.Align.START,
-            line_spacing=4,
-            child_spacing=6,
-        )
-
-        type_label = Gtk.Label(
-            label=f"{relation_type}:",
-            xalign=0.0,
-            valign=Gtk.Align.CENTER,
-            css_classes=[
-                "relation-type",
-            ],
-        )
-        wrap_box.append(type_label)
-
-        for word in words:
-            button = Gtk.Button(label=word, css_classes=["lemma-button"])
-            button.connect("clicked", self._on_word_button_clicked, word)
-            wrap_box.append(button)
-
-        return wrap_box
-
-    def _on_word_button_clicked(self, _button: Gtk.Button, word: str) -> None:
-        """Handles clicks on related word buttons, triggering a new search."""
-        self._search_entry.set_text(word)
-        self._search_entry.emit("activate")
+                )
 
-    def _populate_definitions(self, result: dict[str, Any]) -> None:
-        """Populates the definitions listbox with the search results."""
-        self._clear_definitions()
+        if items:
+            items[-1].group_end = True
+        return items
 
+    def _append_definitions(self, result: dict[str, Any]) -> None:
+        """Adds the definitions of one or more parts of speech to the end of the definitions view."""
+        items = []
         for pos, synsets in result.items():
             if synsets:
-                pos_widget = self._create_definition_widget(pos, synsets)
-                row = Gtk.ListBoxRow(
-                    margin_top=4,
-                    margin_bottom=4,
-                    margin_start=4,
-                    margin_end=4,
-                )
-                row.set_child(pos_widget)
-                self._definitions_listbox.append(row)
-
-                # NOTE Apparently `append` is what adds the `activatable` class.
-                # So, now that the row has been added, we can remove the class.
-                row.remove_css_class("activatable")
+                items.extend(self._create_definition_items(pos, synsets))
+        self._definitions.splice(self._definitions.get_n_items(), 0, items)